@@ -0,0 +1,60 @@
+"""Composite indexes for rate-limit, duplicate-check and listing queries
+
+Tables are created by the app (Base.metadata.create_all), so this revision
+only brings indexes of existing databases in line with the models. Indexes
+are built CONCURRENTLY so large tables stay writable during the migration.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0001"
+down_revision = None
+branch_labels = None
+depends_on = None
+
+# (name, table, columns, partial WHERE clause)
+NEW_INDEXES = [
+    # Keyset pagination
+    ("ix_job_applications_created_at_id", "job_applications", "created_at, id", None),
+    ("ix_project_requests_created_at_id", "project_requests", "created_at, id", None),
+    ("ix_product_inquiries_created_at_id", "product_inquiries", "created_at, id", None),
+    # Rate limits / duplicate checks
+    ("ix_job_applications_email_created_at", "job_applications", "email, created_at", None),
+    ("ix_product_inquiries_email_product_created_at", "product_inquiries", "email, product, created_at", None),
+    ("ix_free_trial_requests_email_created_at", "free_trial_requests", "email, created_at", None),
+    ("ix_contact_inquiries_email_ip_created_at", "contact_inquiries", "email, ip_address, created_at", None),
+    # Admin listing / stats (active applications only)
+    ("ix_job_applications_active_status_created_at", "job_applications", "status, created_at", "is_active"),
+    ("ix_job_applications_active_department", "job_applications", "department", "is_active"),
+]
+
+# Single-column indexes now covered by the leading column of a composite index
+SUPERSEDED_INDEXES = [
+    ("ix_job_applications_email", "job_applications", "email"),
+    ("ix_job_applications_department", "job_applications", "department"),
+    ("ix_free_trial_requests_email", "free_trial_requests", "email"),
+    ("ix_contact_inquiries_email", "contact_inquiries", "email"),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, columns, where in NEW_INDEXES:
+            partial = f" WHERE {where}" if where else ""
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({columns}){partial}")
+
+        for name, _, _ in SUPERSEDED_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in SUPERSEDED_INDEXES:
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} ({column})")
+
+        for name, _, _, _ in NEW_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
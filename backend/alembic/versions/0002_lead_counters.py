@@ -0,0 +1,61 @@
+"""lead_counters rollup table for the stats endpoints
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0002"
+down_revision = "0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # The app may already have created the (empty) table on startup
+    if not sa.inspect(op.get_bind()).has_table("lead_counters"):
+        op.create_table(
+            "lead_counters",
+            sa.Column("module", sa.String(50), primary_key=True),
+            sa.Column("dimension", sa.String(30), primary_key=True),
+            sa.Column("bucket", sa.String(200), primary_key=True),
+            sa.Column("count", sa.BigInteger(), nullable=False, server_default="0"),
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+        )
+
+    # Backfill from the lead tables (enum labels are the upper-case names of the status values,
+    # day buckets are UTC dates like counters.day_bucket())
+    op.execute("DELETE FROM lead_counters")
+    op.execute("""
+        INSERT INTO lead_counters (module, dimension, bucket, count)
+        SELECT 'job_applications', 'status', lower(status::text), count(*)
+          FROM job_applications WHERE is_active AND status IS NOT NULL GROUP BY status
+        UNION ALL
+        SELECT 'project_requests', 'status', lower(status::text), count(*)
+          FROM project_requests WHERE status IS NOT NULL GROUP BY status
+        UNION ALL
+        SELECT 'product_inquiries', 'status', status, count(*)
+          FROM product_inquiries WHERE status IS NOT NULL GROUP BY status
+        UNION ALL
+        SELECT 'product_inquiries', 'product', product, count(*)
+          FROM product_inquiries WHERE product IS NOT NULL GROUP BY product
+        UNION ALL
+        SELECT 'product_inquiries', 'day', (created_at AT TIME ZONE 'UTC')::date::text, count(*)
+          FROM product_inquiries WHERE created_at IS NOT NULL GROUP BY (created_at AT TIME ZONE 'UTC')::date
+        UNION ALL
+        SELECT 'free_trials', 'status', status, count(*)
+          FROM free_trial_requests WHERE status IS NOT NULL GROUP BY status
+        UNION ALL
+        SELECT 'free_trials', 'employees', left(employees, 200), count(*)
+          FROM free_trial_requests WHERE employees IS NOT NULL GROUP BY left(employees, 200)
+        UNION ALL
+        SELECT 'free_trials', 'day', (created_at AT TIME ZONE 'UTC')::date::text, count(*)
+          FROM free_trial_requests WHERE created_at IS NOT NULL GROUP BY (created_at AT TIME ZONE 'UTC')::date
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table("lead_counters")
@@ -0,0 +1,40 @@
+"""submission_id idempotency keys for write-behind lead inserts
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003"
+down_revision = "0002"
+branch_labels = None
+depends_on = None
+
+TABLES = ["contact_inquiries", "product_inquiries", "free_trial_requests"]
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table in TABLES:
+        # Nullable column without default: no table rewrite
+        if "submission_id" not in {column["name"] for column in inspector.get_columns(table)}:
+            op.add_column(table, sa.Column("submission_id", sa.String(36), nullable=True))
+
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(
+                f"CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS {table}_submission_id_key "
+                f"ON {table} (submission_id)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in TABLES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {table}_submission_id_key")
+
+    for table in TABLES:
+        op.drop_column(table, "submission_id")
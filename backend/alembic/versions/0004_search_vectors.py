@@ -0,0 +1,57 @@
+"""Generated tsvector columns + GIN indexes for full-text search
+
+Adding a stored generated column rewrites the table (it takes an ACCESS
+EXCLUSIVE lock while the vectors are computed), so run this in a quiet window
+on large tables. The GIN indexes are then built CONCURRENTLY.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0004"
+down_revision = "0003"
+branch_labels = None
+depends_on = None
+
+# table -> search document (must match the Computed() expressions of the models)
+SEARCH_DOCUMENTS = {
+    "job_applications":
+        "setweight(to_tsvector('english', coalesce(job_title, '') || ' ' || coalesce(full_name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(cover_letter, '')), 'B')",
+    "project_requests":
+        "setweight(to_tsvector('english', coalesce(project_type, '') || ' ' || coalesce(full_name, '') || ' ' || coalesce(company, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+    "contact_inquiries":
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(message, '')), 'B')",
+    "product_inquiries":
+        "setweight(to_tsvector('english', coalesce(product, '') || ' ' || coalesce(company, '') || ' ' || coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(message, '')), 'B')",
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    for table, document in SEARCH_DOCUMENTS.items():
+        if "search_vector" not in {column["name"] for column in inspector.get_columns(table)}:
+            op.execute(f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ({document}) STORED")
+
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_search_vector "
+                f"ON {table} USING gin (search_vector)"
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table in SEARCH_DOCUMENTS:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_search_vector")
+
+    for table in SEARCH_DOCUMENTS:
+        op.drop_column(table, "search_vector")
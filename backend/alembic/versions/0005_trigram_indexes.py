@@ -0,0 +1,40 @@
+"""pg_trgm GIN indexes for substring filters and autocomplete
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0005"
+down_revision = "0004"
+branch_labels = None
+depends_on = None
+
+TRIGRAM_COLUMNS = {
+    "product_inquiries": ["product", "company", "name", "email"],
+    "free_trial_requests": ["company", "name", "email"],
+    "contact_inquiries": ["name", "email"],
+    "project_requests": ["company", "full_name", "email"],
+    "job_applications": ["full_name", "email"],
+}
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    with op.get_context().autocommit_block():
+        for table, columns in TRIGRAM_COLUMNS.items():
+            for column in columns:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_{table}_{column}_trgm "
+                    f"ON {table} USING gin ({column} gin_trgm_ops)"
+                )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, columns in TRIGRAM_COLUMNS.items():
+            for column in columns:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS ix_{table}_{column}_trgm")
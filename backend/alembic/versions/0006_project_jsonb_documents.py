@@ -0,0 +1,40 @@
+"""Unwrap string-encoded JSONB documents of project requests, GIN index on technologies
+
+Older rows stored json.dumps() output in the JSONB columns, i.e. a JSON string
+holding the array ('"[\"React\"]"'). They are rewritten in place as the
+array/object itself so containment queries (technologies @> '["React"]') match.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006"
+down_revision = "0005"
+branch_labels = None
+depends_on = None
+
+DOCUMENT_COLUMNS = ["technologies", "attached_files"]
+
+
+def upgrade() -> None:
+    for column in DOCUMENT_COLUMNS:
+        # #>> '{}' extracts the string content as text, which is then parsed as JSON
+        op.execute(
+            f"UPDATE project_requests SET {column} = ({column} #>> '{{}}')::jsonb "
+            f"WHERE jsonb_typeof({column}) = 'string'"
+        )
+
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_project_requests_technologies "
+            "ON project_requests USING gin (technologies jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    # Documents stay unwrapped: the string-encoded form is what this revision fixes
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_project_requests_technologies")
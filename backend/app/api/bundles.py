@@ -0,0 +1,99 @@
+"""
+ZIP bundles of resumes or project attachments
+
+/download/bundle selects applications or projects by filter or by ID and
+streams their files as one ZIP archive built on the fly (see
+app.core.zip_stream). Rows are read with a server-side cursor, so the
+download starts right away and memory stays flat however many files match.
+"""
+import os
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, List, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from app.core.config import settings
+from app.core.utils import sanitize_filename
+from app.core.zip_stream import stream_zip
+from app.database import AsyncSessionLocal
+from app.models.job_application import JobApplication, ApplicationStatus
+from app.models.project_request import ProjectRequest, ProjectStatus
+
+router = APIRouter()
+
+async def _resume_entries(query) -> AsyncIterator[Tuple[str, str, Optional[datetime]]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for application_id, full_name, resume_path, created_at in result:
+            if not resume_path:
+                continue
+            extension = os.path.splitext(resume_path)[1]
+            yield f"{application_id}_{sanitize_filename(full_name)}{extension}", resume_path, created_at
+
+async def _attachment_entries(query) -> AsyncIterator[Tuple[str, str, Optional[datetime]]]:
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for project_id, attached_files, created_at in result:
+            for attachment in attached_files or []:
+                if not attachment.get("path"):
+                    continue
+                name = sanitize_filename(attachment.get("original_name") or attachment.get("saved_name"))
+                yield f"{project_id}/{name}", attachment["path"], created_at
+
+@router.get("/download/bundle")
+async def download_bundle(
+    kind: str = Query("resumes", pattern="^(resumes|attachments)$"),
+    ids: Optional[List[str]] = Query(None),
+    department: Optional[str] = None,
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+):
+    """
+    Stream a ZIP of resumes (by application) or project attachments (by project)
+    Select by ?ids=APP-...&ids=APP-... (application / project IDs) and/or
+    department (resumes only), status, date_from / date_to (inclusive, on created_at)
+    """
+    if kind == "resumes":
+        model, key, status_enum = JobApplication, JobApplication.application_id, ApplicationStatus
+        query = select(
+            JobApplication.application_id,
+            JobApplication.full_name,
+            JobApplication.resume_path,
+            JobApplication.created_at
+        ).where(JobApplication.is_active == True)
+        if department:
+            query = query.where(JobApplication.department == department)
+    else:
+        if department:
+            raise HTTPException(status_code=400, detail="Project attachments have no department filter")
+        model, key, status_enum = ProjectRequest, ProjectRequest.project_id, ProjectStatus
+        query = select(
+            ProjectRequest.project_id,
+            ProjectRequest.attached_files,
+            ProjectRequest.created_at
+        )
+
+    if ids:
+        query = query.where(key.in_(ids))
+    if status:
+        try:
+            query = query.where(model.status == status_enum(status.lower()))
+        except ValueError:
+            raise HTTPException(status_code=400, detail=f"Invalid status value: {status}")
+    if date_from:
+        query = query.where(model.created_at >= date_from)
+    if date_to:
+        query = query.where(model.created_at < date_to + timedelta(days=1))
+
+    query = query.order_by(model.id)
+    entries = _resume_entries(query) if kind == "resumes" else _attachment_entries(query)
+
+    filename = f"{kind}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.zip"
+    print(f"📦 Streaming {kind} bundle")
+
+    return StreamingResponse(
+        stream_zip(entries),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,133 @@
+"""
+Bulk export of leads as CSV or NDJSON
+
+Rows are read with a server-side cursor (AsyncSession.stream + yield_per) as
+plain Core rows - no ORM objects or response models - and written to the
+response one batch at a time, so memory stays flat however many rows match.
+"""
+import csv
+import enum
+import io
+import json
+from datetime import date, datetime, timedelta
+from typing import AsyncIterator, Optional
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Enum, select
+from app.core.config import settings
+from app.database import AsyncSessionLocal
+from app.models.job_application import JobApplication
+from app.models.project_request import ProjectRequest
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+from app.models.contact import ContactInquiry
+
+router = APIRouter()
+
+# Dataset name -> model (models without a status column cannot be filtered by status)
+EXPORT_MODELS = {
+    "applications": JobApplication,
+    "projects": ProjectRequest,
+    "inquiries": ProductInquiry,
+    "trials": FreeTrialRequest,
+    "contacts": ContactInquiry,
+}
+
+MEDIA_TYPES = {
+    "csv": "text/csv",
+    "ndjson": "application/x-ndjson",
+}
+
+def _plain(value):
+    """
+    JSON/CSV friendly version of a column value
+    """
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+def _csv_cell(value):
+    value = _plain(value)
+    if isinstance(value, (dict, list)):
+        return json.dumps(value)
+    return value
+
+def _status_value(model, status: str):
+    column = model.__table__.c.get("status")
+    if column is None:
+        raise HTTPException(status_code=400, detail="This export has no status filter")
+
+    enum_class = getattr(column.type, "enum_class", None) if isinstance(column.type, Enum) else None
+    if enum_class is None:
+        return status
+    try:
+        return enum_class(status.lower())
+    except ValueError:
+        raise HTTPException(status_code=400, detail=f"Invalid status value: {status}")
+
+async def _stream_rows(query, columns, export_format: str) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    if export_format == "csv":
+        writer.writerow(columns)
+
+    async with AsyncSessionLocal() as db:
+        result = await db.stream(query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        async for rows in result.partitions():
+            for row in rows:
+                if export_format == "csv":
+                    writer.writerow([_csv_cell(value) for value in row])
+                else:
+                    buffer.write(json.dumps({name: _plain(value) for name, value in zip(columns, row)}, default=str))
+                    buffer.write("\n")
+
+            yield buffer.getvalue().encode()
+            buffer.seek(0)
+            buffer.truncate()
+
+    # Header of an empty CSV export
+    if buffer.tell():
+        yield buffer.getvalue().encode()
+
+@router.get("/export/{dataset}")
+async def export_leads(
+    dataset: str,
+    format: str = Query("csv", pattern="^(csv|ndjson)$"),
+    status: Optional[str] = None,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None
+):
+    """
+    Stream every lead of a dataset (applications, projects, inquiries, trials, contacts)
+    Optional filters: status, date_from / date_to (inclusive, on created_at)
+    """
+    model = EXPORT_MODELS.get(dataset)
+    if model is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown export. Available: {', '.join(EXPORT_MODELS)}"
+        )
+
+    table = model.__table__
+    columns = [column for column in table.c if column.computed is None]
+    query = select(*columns).order_by(table.c.id)
+
+    if dataset == "applications":
+        query = query.where(table.c.is_active == True)
+    if status:
+        query = query.where(table.c.status == _status_value(model, status))
+    if date_from:
+        query = query.where(table.c.created_at >= date_from)
+    if date_to:
+        query = query.where(table.c.created_at < date_to + timedelta(days=1))
+
+    filename = f"{dataset}-{datetime.now().strftime('%Y%m%d-%H%M%S')}.{format}"
+    print(f"📤 Exporting {dataset} as {format}")
+
+    return StreamingResponse(
+        _stream_rows(query, [column.name for column in columns], format),
+        media_type=MEDIA_TYPES[format],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
@@ -0,0 +1,44 @@
+"""
+Bulk import of historical leads (admin) - see app/core/bulk_import.py
+"""
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.database import get_db
+from app.core.bulk_import import IMPORTABLE, detect_format, import_leads
+
+router = APIRouter()
+
+@router.post("/import/{dataset}")
+async def bulk_import_leads(
+    dataset: str,
+    file: UploadFile = File(...),
+    format: Optional[str] = Form(None),
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Import a CSV (header row) or NDJSON file of contacts, inquiries or trials
+    Returns the imported / rejected counts and the path of the rejected-rows report
+    """
+    if dataset not in IMPORTABLE:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Unknown import. Available: {', '.join(IMPORTABLE)}"
+        )
+
+    file_format = format or detect_format(file.filename or "")
+    if file_format not in ("csv", "ndjson"):
+        raise HTTPException(status_code=400, detail="format must be csv or ndjson")
+
+    print(f"📥 Importing {dataset} from {file.filename} ({file_format})")
+
+    try:
+        # The upload is already spooled to a temporary file; it is read in batches
+        result = await import_leads(db, dataset, file.file, file_format)
+    except Exception as e:
+        await db.rollback()
+        print(f"❌ Import failed: {str(e)}")
+        raise HTTPException(status_code=500, detail=f"Import failed: {str(e)}")
+
+    print(f"✅ Imported {result['imported']} {dataset}, rejected {result['rejected']}")
+    return result
@@ -1,10 +1,11 @@
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, status
-from fastapi.responses import JSONResponse, FileResponse
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Query, Request, Response, status
+from fastapi.responses import JSONResponse
+from sqlalchemy.ext.asyncio import AsyncSession
 from typing import List, Optional, Dict
 import os
 import uuid
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime, timezone
 import traceback
 import json
 import logging
@@ -19,16 +20,32 @@ from app.schemas.job_application import (
     ApplicationStatus as SchemaApplicationStatus
 )
 from app.core.config import settings
+from app.core.storage import (
+    save_upload_stream,
+    add_file_reference,
+    discard_uploads,
+    UploadTooLargeError,
+    UploadLostError
+)
+from app.core.sniffing import UploadTypeError
+from app.core.inserts import insert_returning, under_rate
+from app.core.pagination import clamp_page_size, paginate, next_cursor
+from app.core.fields import parse_fields, load_only_fields, schema_columns, list_response
+from app.core.file_serving import serve_upload
+from app.core.http_cache import cache_headers, is_conditional, is_not_modified, not_modified_response, probe_row, row_validators, conditional_page
+from app.core import counters
+from app.core.cache import cache, invalidate_module, OVERVIEW
+from app.core.rate_limit import rate_limiter
+from app.core.write_behind import write_behind, QueueFullError
 from app.core.utils import (
-    save_uploaded_file, 
     generate_application_id,
     generate_project_id,
     validate_file_by_extension,
-    validate_file_size,
     get_client_ip,
     sanitize_filename
 )
-from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import undefer_group
 from app.models.project_request import ProjectRequest, ProjectStatus
 from app.schemas.project_request import ProjectRequestCreate, ProjectRequestResponse
 from app.schemas.product_inquiry import ProductInquiryCreate, ProductInquiryUpdate, ProductInquiryResponse, FreeTrialCreate, FreeTrialUpdate, FreeTrialResponse
@@ -41,6 +58,28 @@ ProjectRequestResponse.model_rebuild(force=True)
 
 router = APIRouter()
 
+async def enqueue_submission(module: str, values: Dict) -> JSONResponse:
+    """
+    Hand a new lead to the write-behind queue and answer 202 Accepted
+    (the row is inserted by the next batch flush)
+    """
+    values["submission_id"] = str(uuid.uuid4())
+    values["created_at"] = datetime.now(timezone.utc)
+    
+    try:
+        await write_behind.enqueue(module, values)
+    except QueueFullError:
+        raise HTTPException(
+            status_code=503,
+            detail="We are receiving a lot of requests right now. Please try again shortly.",
+            headers={"Retry-After": "1"}
+        )
+    
+    return JSONResponse(
+        status_code=202,
+        content={"submission_id": values["submission_id"], "status": "queued"}
+    )
+
 # ==================== EXISTING JOB APPLICATION ENDPOINTS ====================
 @router.post("/apply", response_model=JobApplicationResponse, status_code=status.HTTP_201_CREATED)
 async def submit_application(
@@ -57,7 +96,7 @@ async def submit_application(
     job_type: str = Form("full_time"),
     department: Optional[str] = Form(None),
     resume: UploadFile = File(...),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a job application with minimal fields
@@ -65,15 +104,11 @@ async def submit_application(
     print(f"📥 Received application for: {job_title}")
     print(f"👤 From: {full_name} ({email})")
     
+    saved_resume = None
     try:
-        # Check daily application limit
-        today_start = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
-        today_count = db.query(JobApplication).filter(
-            JobApplication.email == email,
-            JobApplication.created_at >= today_start
-        ).count()
-        
-        if today_count >= settings.MAX_APPLICATIONS_PER_DAY:
+        # Check daily application limit (in-memory / shared counter, no DB round trip)
+        apply_rate = f"{settings.MAX_APPLICATIONS_PER_DAY}/day"
+        if not await rate_limiter.check("apply", email.lower(), apply_rate):
             raise HTTPException(
                 status_code=status.HTTP_429_TOO_MANY_REQUESTS,
                 detail=f"Maximum {settings.MAX_APPLICATIONS_PER_DAY} applications per day allowed"
@@ -89,32 +124,35 @@ async def submit_application(
                 detail=f"Invalid file type. Allowed types: {', '.join(settings.ALLOWED_FILE_TYPES)}"
             )
         
-        # Read file content
-        print("📖 Reading file content...")
-        file_content = await resume.read()
-        print(f"📊 File size: {len(file_content)} bytes")
+        # Sanitize filename
+        original_filename = sanitize_filename(resume.filename)
+        file_extension = os.path.splitext(original_filename)[1]
         
-        # Validate file size
-        if not validate_file_size(file_content, settings.MAX_UPLOAD_SIZE):
-            print(f"❌ File too large: {len(file_content)} > {settings.MAX_UPLOAD_SIZE}")
+        # Copy the (already spooled) file into the content-addressed store, checking its size
+        # limit as it goes; the whole request body is capped by RequestBodyLimitMiddleware
+        try:
+            saved_resume = await save_upload_stream(
+                resume,
+                "resumes",
+                file_extension,
+                settings.MAX_UPLOAD_SIZE,
+                settings.ALLOWED_FILE_TYPES
+            )
+        except UploadTooLargeError:
+            print(f"❌ File too large: > {settings.MAX_UPLOAD_SIZE}")
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"File too large. Maximum size: {settings.MAX_UPLOAD_SIZE / 1024 / 1024}MB"
             )
+        except UploadTypeError as te:
+            print(f"❌ Rejected resume content: {te}")
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"File content does not match a valid {file_extension or 'resume'} document"
+            )
         
-        # Sanitize filename
-        original_filename = sanitize_filename(resume.filename)
-        file_extension = os.path.splitext(original_filename)[1]
-        
-        # Generate unique filename
-        file_name = f"{uuid.uuid4()}{file_extension}"
-        print(f"💾 Saving file as: {file_name}")
-        
-        resume_path = save_uploaded_file(
-            file_content, 
-            "resumes", 
-            file_name
-        )
+        resume_path = saved_resume["path"]
+        print(f"💾 Stored file as: {resume_path} ({saved_resume['size']} bytes, deduplicated={saved_resume['deduplicated']})")
         
         # Generate unique application ID
         application_id = generate_application_id()
@@ -151,11 +189,28 @@ async def submit_application(
         
         print(f"📝 Creating database record: {application_id}")
         
-        # Create database record
-        db_application = JobApplication(**application_data)
-        db.add(db_application)
-        db.commit()
-        db.refresh(db_application)
+        # Create database record (RETURNING: no refresh after commit); the daily
+        # limit is re-checked in the same statement in case other workers took it
+        db_application = await insert_returning(
+            db,
+            JobApplication,
+            application_data,
+            guard=under_rate(JobApplication, apply_rate, email=email)
+        )
+        if db_application is None:
+            await db.rollback()
+            # Keep the file if a concurrent application with the same bytes references it
+            await discard_uploads(db, [resume_path])
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail=f"Maximum {settings.MAX_APPLICATIONS_PER_DAY} applications per day allowed"
+            )
+        
+        await add_file_reference(db, saved_resume)
+        await counters.bump_counters(db, counters.JOB_APPLICATIONS, {"status": ApplicationStatus.PENDING})
+        await db.commit()
+        await invalidate_module(counters.JOB_APPLICATIONS)
+        await rate_limiter.record("apply", email.lower(), apply_rate)
         
         print(f"✅ Application submitted: {application_id} for {job_title}")
         
@@ -163,8 +218,16 @@ async def submit_application(
         
     except HTTPException:
         raise
+    except UploadLostError:
+        await db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="The upload was interrupted, please submit again"
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        if saved_resume:
+            await discard_uploads(db, [saved_resume["path"]])
         print(f"❌ Error submitting application: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(
@@ -174,33 +237,57 @@ async def submit_application(
 
 @router.get("/applications", response_model=List[JobApplicationResponse])
 async def get_applications(
+    request: Request,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     department: Optional[str] = None,
     status: Optional[str] = None,
-    db: Session = Depends(get_db)
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all job applications
+    Pass the X-Next-Cursor response header back as ?cursor= to get the next page
+    ?fields=id,full_name,status returns (and loads) only those fields
     """
+    limit = clamp_page_size(limit)
+    
     try:
-        query = db.query(JobApplication).filter(JobApplication.is_active == True)
+        # Plain Core rows (no ORM objects), serialized straight to JSON below
+        selected_fields = parse_fields(fields, JobApplicationResponse)
+        query = select(
+            *schema_columns(JobApplication, JobApplicationResponse, selected_fields)
+        ).where(JobApplication.is_active == True)
         
         if department:
-            query = query.filter(JobApplication.department == department)
+            query = query.where(JobApplication.department == department)
         
         if status:
             # Convert string status to enum
             try:
                 status_enum = ApplicationStatus(status.lower())
-                query = query.filter(JobApplication.status == status_enum)
+                query = query.where(JobApplication.status == status_enum)
             except ValueError:
                 # If invalid status, ignore filter
                 print(f"⚠️ Invalid status filter: {status}")
         
-        applications = query.order_by(JobApplication.created_at.desc()).offset(skip).limit(limit).all()
-        return applications
+        applications = (await db.execute(
+            paginate(query, JobApplication, limit, skip, cursor)
+        )).all()
+        
+        headers = {}
+        cursor_token = next_cursor(applications, limit)
+        if cursor_token:
+            headers["X-Next-Cursor"] = cursor_token
+        # Unchanged page -> 304 (ETag of the serialized page, no extra query)
+        return conditional_page(
+            request,
+            list_response(JobApplicationResponse, selected_fields, applications, headers=headers)
+        )
         
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
         print(f"❌ Error fetching applications: {str(e)}")
         raise HTTPException(
@@ -208,18 +295,59 @@ async def get_applications(
             detail=f"Error fetching applications: {str(e)}"
         )
 
+@router.get("/applications/stats", response_model=ApplicationStats)
+async def get_application_stats(db: AsyncSession = Depends(get_db)):
+    """
+    Get application statistics
+    Read from the lead_counters rollup (one row per status), not from job_applications
+    (registered before /applications/{application_id} so "stats" is not taken as an ID)
+    """
+    async def load_stats():
+        lead_counters = await counters.read_counters(db, [counters.JOB_APPLICATIONS])
+        by_status = lead_counters[counters.JOB_APPLICATIONS]["status"]
+        
+        return ApplicationStats(
+            total=sum(by_status.values()),
+            **{
+                application_status.value: by_status.get(application_status.value, 0)
+                for application_status in ApplicationStatus
+            }
+        ).model_dump()
+    
+    try:
+        return await cache.get_or_set(counters.JOB_APPLICATIONS, "stats", load_stats)
+        
+    except Exception as e:
+        print(f"❌ Error fetching statistics: {str(e)}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Error fetching statistics: {str(e)}"
+        )
+
 @router.get("/applications/{application_id}", response_model=JobApplicationResponse)
 async def get_application(
+    request: Request,
+    response: Response,
     application_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get specific application by ID
+    Get specific application by ID (If-None-Match / If-Modified-Since -> 304)
     """
-    application = db.query(JobApplication).filter(
+    conditions = (
         JobApplication.application_id == application_id,
         JobApplication.is_active == True
-    ).first()
+    )
+    
+    # Probe first only when the client has a copy that may still be current
+    if is_conditional(request):
+        validators = await probe_row(db, JobApplication, *conditions)
+        if validators is not None and is_not_modified(request, *validators):
+            return not_modified_response(cache_headers(*validators))
+    
+    application = await db.scalar(
+        select(JobApplication).where(*conditions).options(undefer_group("heavy"))
+    )
     
     if not application:
         raise HTTPException(
@@ -227,20 +355,23 @@ async def get_application(
             detail="Application not found"
         )
     
+    response.headers.update(cache_headers(*row_validators(application)))
     return application
 
 @router.patch("/applications/{application_id}", response_model=JobApplicationResponse)
 async def update_application(
     application_id: str,
     update_data: JobApplicationUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update application status
     """
-    application = db.query(JobApplication).filter(
-        JobApplication.application_id == application_id
-    ).first()
+    application = await db.scalar(
+        select(JobApplication).where(
+            JobApplication.application_id == application_id
+        ).options(undefer_group("heavy"))
+    )
     
     if not application:
         raise HTTPException(
@@ -248,10 +379,17 @@ async def update_application(
             detail="Application not found"
         )
     
+    old_status = application.status
+    
     # Update fields
     update_dict = update_data.dict(exclude_unset=True)
+    if "status" in update_dict and update_dict["status"] is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="status cannot be null"
+        )
     for field, value in update_dict.items():
-        if field == 'status' and value:
+        if field == 'status':
             # Convert string to enum if needed
             if isinstance(value, str):
                 try:
@@ -263,96 +401,39 @@ async def update_application(
                     )
         setattr(application, field, value)
     
+    if application.is_active:
+        await counters.move_counter(db, counters.JOB_APPLICATIONS, "status", old_status, application.status)
+    
     application.updated_at = datetime.now()
-    db.commit()
-    db.refresh(application)
+    await db.commit()
+    await invalidate_module(counters.JOB_APPLICATIONS)
     
     return application
 
-@router.get("/applications/stats", response_model=ApplicationStats)
-async def get_application_stats(db: Session = Depends(get_db)):
-    """
-    Get application statistics
-    """
-    try:
-        # Total count
-        total = db.query(JobApplication).filter(JobApplication.is_active == True).count()
-        
-        # Count by status - use enum directly
-        pending = db.query(JobApplication).filter(
-            JobApplication.status == ApplicationStatus.PENDING,
-            JobApplication.is_active == True
-        ).count()
-        
-        reviewed = db.query(JobApplication).filter(
-            JobApplication.status == ApplicationStatus.REVIEWED,
-            JobApplication.is_active == True
-        ).count()
-        
-        shortlisted = db.query(JobApplication).filter(
-            JobApplication.status == ApplicationStatus.SHORTLISTED,
-            JobApplication.is_active == True
-        ).count()
-        
-        hired = db.query(JobApplication).filter(
-            JobApplication.status == ApplicationStatus.HIRED,
-            JobApplication.is_active == True
-        ).count()
-        
-        rejected = db.query(JobApplication).filter(
-            JobApplication.status == ApplicationStatus.REJECTED,
-            JobApplication.is_active == True
-        ).count()
-        
-        return ApplicationStats(
-            total=total,
-            pending=pending,
-            reviewed=reviewed,
-            shortlisted=shortlisted,
-            hired=hired,
-            rejected=rejected
-        )
-        
-    except Exception as e:
-        print(f"❌ Error fetching statistics: {str(e)}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"Error fetching statistics: {str(e)}"
-        )
-
 @router.get("/download/resume/{application_id}")
 async def download_resume(
+    request: Request,
     application_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Download resume file
+    Download resume file (supports Range, ETag / If-None-Match, proxy offload)
     """
-    application = db.query(JobApplication).filter(
-        JobApplication.application_id == application_id
-    ).first()
-    
-    if not application or not application.resume_path:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume not found"
+    resume_path = await db.scalar(
+        select(JobApplication.resume_path).where(
+            JobApplication.application_id == application_id
         )
+    )
     
-    resume_path = os.path.join(settings.UPLOAD_DIR, application.resume_path)
-    
-    if not os.path.exists(resume_path):
+    if not resume_path:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
-            detail="Resume file not found"
+            detail="Resume not found"
         )
     
-    # Extract filename from path
-    filename = os.path.basename(resume_path)
-    return FileResponse(
-        path=resume_path,
-        filename=filename,
-        media_type='application/octet-stream'
-    )
+    # Name the download after the application rather than the content hash
+    filename = f"{application_id}{os.path.splitext(resume_path)[1]}"
+    return await serve_upload(request, db, resume_path, filename)
 
 @router.get("/jobs/openings")
 async def get_job_openings():
@@ -391,18 +472,23 @@ async def get_job_openings():
     return job_openings
 
 @router.get("/departments")
-async def get_departments(db: Session = Depends(get_db)):
+async def get_departments(db: AsyncSession = Depends(get_db)):
     """
     Get unique departments from applications
     """
-    try:
-        departments = db.query(JobApplication.department).filter(
-            JobApplication.department.isnot(None),
-            JobApplication.is_active == True
-        ).distinct().all()
+    async def load_departments():
+        departments = await db.scalars(
+            select(JobApplication.department).where(
+                JobApplication.department.isnot(None),
+                JobApplication.is_active == True
+            ).distinct()
+        )
         
         # Filter out None values and return as list
-        return [dept[0] for dept in departments if dept[0]]
+        return [dept for dept in departments if dept]
+    
+    try:
+        return await cache.get_or_set(counters.JOB_APPLICATIONS, "departments", load_departments)
     except Exception as e:
         print(f"❌ Error fetching departments: {str(e)}")
         return []
@@ -422,65 +508,41 @@ async def submit_project_request(
     description: str = Form(...),
     technologies: str = Form("[]"),
     files: List[UploadFile] = File([]),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a new project request
     """
+    saved_files = []
     try:
         print(f"📋 Received project request from: {full_name} ({email})")
         
-        # Parse technologies JSON
+        # Parse technologies JSON (stored as a native JSONB array of strings)
         try:
-            technologies_list = json.loads(technologies)
-        except:
-            technologies_list = []
+            parsed_technologies = json.loads(technologies or "[]")
+        except ValueError:
+            parsed_technologies = None
+        if not isinstance(parsed_technologies, list):
+            raise HTTPException(
+                status_code=400,
+                detail="technologies must be a JSON array of strings"
+            )
+        technologies_list = [str(tech) for tech in parsed_technologies]
         
         # Generate project ID
         project_id = generate_project_id()
         
-        # Save uploaded files
-        saved_files = []
-        for file in files:
-            if file.filename:
-                # Validate file
-                if not validate_file(file):
-                    continue
-                
-                # Generate unique filename
-                file_extension = os.path.splitext(file.filename)[1]
-                file_name = f"{uuid.uuid4()}{file_extension}"
-                
-                # Read file content
-                file_content = await file.read()
-
-                # Validate file size
-                if len(file_content) > 10 * 1024 * 1024:  # 10MB
-                    print(f"⚠️ File too large: {file.filename}")
-                    continue
-
-                
-                # Save file
-                file_path = save_uploaded_file(
-                    file_content,
-                    "project_docs",
-                    file_name
-                )
-                
-                saved_files.append({
-                    "original_name": file.filename,
-                    "saved_name": file_name,
-                    "path": file_path,
-                    "size": len(file_content)
-                })
-
-         # IMPORTANT: Convert saved_files to JSON string
-        # This is what fixes the "can't adapt type 'dict'" error
-        if saved_files:
-            attached_files_json = json.dumps(saved_files)
-        else:
-            attached_files_json = None
-        
+        # Save uploaded files concurrently (capped per request), keeping the original order
+        upload_slots = asyncio.Semaphore(settings.PROJECT_UPLOAD_CONCURRENCY)
+        results = await asyncio.gather(*[
+            save_project_file(file, upload_slots) for file in files
+        ], return_exceptions=True)
+        # Files saved before another one failed are still cleaned up below
+        saved_files = [saved for saved in results if isinstance(saved, dict)]
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+
         # Create project request record
         project_data = {
             "project_id": project_id,
@@ -492,21 +554,23 @@ async def submit_project_request(
             "budget": budget,
             "timeline": timeline,
             "description": description,
-            "technologies": json.dumps(technologies_list),
-            "attached_files": attached_files_json,
+            "technologies": technologies_list,
+            "attached_files": saved_files or None,
             "ip_address": get_client_ip(request),
             "user_agent": request.headers.get("user-agent", ""),
             "status": ProjectStatus.NEW.value
         }
         
         print(f"📝 Creating project record: {project_id}")
-        print(f"📎 Attached files (JSON): {attached_files_json}")
+        print(f"📎 Attached files: {len(saved_files)}")
         
-        # Create database record
-        db_project = ProjectRequest(**project_data)
-        db.add(db_project)
-        db.commit()
-        db.refresh(db_project)
+        # Create database record (RETURNING: no refresh after commit)
+        db_project = await insert_returning(db, ProjectRequest, project_data)
+        for saved_file in saved_files:
+            await add_file_reference(db, saved_file)
+        await counters.bump_counters(db, counters.PROJECT_REQUESTS, {"status": ProjectStatus.NEW})
+        await db.commit()
+        await invalidate_module(counters.PROJECT_REQUESTS)
         
         print(f"✅ Project request submitted: {project_id}")
         
@@ -515,8 +579,19 @@ async def submit_project_request(
         
         return db_project
         
+    except HTTPException:
+        raise
+    except UploadLostError:
+        await db.rollback()
+        await discard_uploads(db, [saved_file["path"] for saved_file in saved_files])
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="An upload was interrupted, please submit again"
+        )
     except Exception as e:
-        db.rollback()
+        await db.rollback()
+        # Attachments nothing references would stay on disk forever
+        await discard_uploads(db, [saved_file["path"] for saved_file in saved_files])
         print(f"❌ Error submitting project request: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(
@@ -524,6 +599,43 @@ async def submit_project_request(
             detail=f"Error submitting project request: {str(e)}"
         )
 
+async def save_project_file(file: UploadFile, upload_slots: asyncio.Semaphore) -> Optional[Dict]:
+    """Validate and stream one project attachment to disk, returns its metadata or None if skipped"""
+    if not file.filename:
+        return None
+    
+    # Validate file
+    if not validate_file(file):
+        return None
+    
+    file_extension = os.path.splitext(file.filename)[1]
+    
+    async with upload_slots:
+        # Copy the (already spooled) file into the content-addressed store, checking its size
+        # limit as it goes; the whole request body is capped by RequestBodyLimitMiddleware
+        try:
+            saved_file = await save_upload_stream(
+                file,
+                "project_docs",
+                file_extension,
+                settings.MAX_PROJECT_FILE_SIZE,
+                settings.ALLOWED_PROJECT_FILE_TYPES
+            )
+        except UploadTooLargeError:
+            print(f"⚠️ File too large: {file.filename}")
+            return None
+        except UploadTypeError as te:
+            print(f"⚠️ Rejected file content: {file.filename} ({te})")
+            return None
+    
+    return {
+        "original_name": file.filename,
+        "saved_name": os.path.basename(saved_file["path"]),
+        "path": saved_file["path"],
+        "size": saved_file["size"],
+        "sha256": saved_file["sha256"]
+    }
+
 def validate_file(file: UploadFile) -> bool:
     """Validate uploaded file"""
     allowed_types = [
@@ -538,38 +650,78 @@ def validate_file(file: UploadFile) -> bool:
         'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     ]
     
-    max_size = 10 * 1024 * 1024  # 10MB
-    
     # Check file type
     if file.content_type not in allowed_types:
         return False
     
-    # We'll check size after reading (in the route)
+    # Real type (first chunk) and size are enforced while streaming (see save_upload_stream)
     return True
 
 @router.get("/projects", response_model=List[ProjectRequestResponse])
 async def get_project_requests(
+    request: Request,
     skip: int = 0,
     limit: int = 20,
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
-    db: Session = Depends(get_db)
+    technology: Optional[List[str]] = Query(None),
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get all project requests (admin only)"""
-    query = db.query(ProjectRequest)
+    """
+    Get all project requests (admin only), paginated with ?cursor= / X-Next-Cursor
+    ?technology=React&technology=Python returns projects using all of them
+    ?fields=project_id,full_name,status returns (and loads) only those fields
+    """
+    limit = clamp_page_size(limit)
+    try:
+        selected_fields = parse_fields(fields, ProjectRequestResponse)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    query = select(ProjectRequest)
     
     if status:
-        query = query.filter(ProjectRequest.status == status)
+        query = query.where(ProjectRequest.status == status)
+    if technology:
+        # technologies @> '["React", "Python"]' - served by the jsonb_path_ops GIN index
+        query = query.where(ProjectRequest.technologies.contains(technology))
+    
+    query = query.options(
+        load_only_fields(ProjectRequest, selected_fields) if selected_fields else undefer_group("heavy")
+    )
+    try:
+        query = paginate(query, ProjectRequest, limit, skip, cursor)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
     
-    projects = query.order_by(ProjectRequest.created_at.desc()).offset(skip).limit(limit).all()
-    return projects
+    projects = (await db.scalars(query)).all()
+    
+    headers = {}
+    cursor_token = next_cursor(projects, limit)
+    if cursor_token:
+        headers["X-Next-Cursor"] = cursor_token
+    # Unchanged page -> 304 (ETag of the serialized page, no extra query)
+    return conditional_page(
+        request,
+        list_response(ProjectRequestResponse, selected_fields, projects, headers=headers)
+    )
 
 @router.get("/projects/{project_id}", response_model=ProjectRequestResponse)
 async def get_project_request(
+    request: Request,
+    response: Response,
     project_id: str,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
-    """Get specific project request"""
-    project = db.query(ProjectRequest).filter(ProjectRequest.project_id == project_id).first()
+    """Get specific project request (If-None-Match / If-Modified-Since -> 304)"""
+    if is_conditional(request):
+        validators = await probe_row(db, ProjectRequest, ProjectRequest.project_id == project_id)
+        if validators is not None and is_not_modified(request, *validators):
+            return not_modified_response(cache_headers(*validators))
+    
+    project = await db.scalar(
+        select(ProjectRequest).where(ProjectRequest.project_id == project_id).options(undefer_group("heavy"))
+    )
     
     if not project:
         raise HTTPException(
@@ -577,31 +729,76 @@ async def get_project_request(
             detail="Project request not found"
         )
     
+    response.headers.update(cache_headers(*row_validators(project)))
     return project
 
+@router.get("/projects/{project_id}/files/{saved_name}")
+async def download_project_file(
+    request: Request,
+    project_id: str,
+    saved_name: str,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Download one attachment of a project request (supports Range, ETag / If-None-Match, proxy offload)
+    """
+    attached_files = await db.scalar(
+        select(ProjectRequest.attached_files).where(ProjectRequest.project_id == project_id)
+    )
+    
+    attachment = next(
+        (file for file in attached_files or [] if file.get("saved_name") == saved_name),
+        None
+    )
+    if attachment is None or not attachment.get("path"):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Attachment not found"
+        )
+    
+    return await serve_upload(
+        request,
+        db,
+        attachment["path"],
+        attachment.get("original_name") or saved_name,
+        attachment.get("sha256")
+    )
+
 @router.patch("/projects/{project_id}")
 async def update_project_status(
     project_id: str,
     status: str = Form(...),
     notes: Optional[str] = Form(None),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """Update project status (admin only)"""
-    project = db.query(ProjectRequest).filter(ProjectRequest.project_id == project_id).first()
+    # Normalize first: "NEW" and "new" are the same status (and the same counter bucket)
+    try:
+        new_status = ProjectStatus(status.lower())
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status value: {status}"
+        )
+    
+    project = await db.scalar(
+        select(ProjectRequest).where(ProjectRequest.project_id == project_id).options(undefer_group("heavy"))
+    )
     
     if not project:
         raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
+            status_code=404,
             detail="Project request not found"
         )
     
     # Update status
-    project.status = status
+    await counters.move_counter(db, counters.PROJECT_REQUESTS, "status", project.status, new_status)
+    project.status = new_status
     project.notes = notes
     project.updated_at = datetime.now()
     
-    db.commit()
-    db.refresh(project)
+    await db.commit()
+    await invalidate_module(counters.PROJECT_REQUESTS)
     
     return {"message": "Project status updated successfully", "project": project}
 
@@ -614,7 +811,7 @@ from fastapi import Body  # Add this if not already imported
 async def submit_product_inquiry(
     request: Request,
     inquiry_data: ProductInquiryCreate,  # Use Pydantic schema directly
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a product inquiry - Now accepts JSON body (matches frontend)
@@ -624,15 +821,9 @@ async def submit_product_inquiry(
         print(f"📦 Received product inquiry for: {data['product']}")
         print(f"👤 From: {data['name']} ({data['email']}) | Company: {data['company']}")
         
-        # Optional: Prevent duplicates
-        yesterday = datetime.now() - timedelta(days=1)
-        existing = db.query(ProductInquiry).filter(
-            ProductInquiry.email == data['email'],
-            ProductInquiry.product == data['product'],
-            ProductInquiry.created_at >= yesterday
-        ).first()
-        
-        if existing:
+        # Optional: Prevent duplicates (in-memory / shared counter, no DB round trip)
+        inquiry_key = f"{data['email'].lower()}:{data['product']}"
+        if not await rate_limiter.check("inquiry", inquiry_key, settings.RATE_LIMIT_INQUIRY):
             raise HTTPException(
                 status_code=429,
                 detail="You have already submitted an inquiry for this product recently."
@@ -646,53 +837,111 @@ async def submit_product_inquiry(
             "priority": "medium"
         })
         
-        db_inquiry = ProductInquiry(**data)
-        db.add(db_inquiry)
-        db.commit()
-        db.refresh(db_inquiry)
+        if write_behind.running:
+            accepted = await enqueue_submission(counters.PRODUCT_INQUIRIES, data)
+            await rate_limiter.record("inquiry", inquiry_key, settings.RATE_LIMIT_INQUIRY)
+            print(f"📥 Product inquiry queued: {accepted.body.decode()}")
+            return accepted
+        
+        db_inquiry = await insert_returning(
+            db,
+            ProductInquiry,
+            data,
+            guard=under_rate(ProductInquiry, settings.RATE_LIMIT_INQUIRY, email=data["email"], product=data["product"])
+        )
+        if db_inquiry is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=429,
+                detail="You have already submitted an inquiry for this product recently."
+            )
+        
+        await counters.bump_counters(db, counters.PRODUCT_INQUIRIES, {
+            "status": data["status"],
+            "product": data["product"],
+            "day": counters.day_bucket(db_inquiry["created_at"])
+        })
+        await db.commit()
+        await invalidate_module(counters.PRODUCT_INQUIRIES)
+        await rate_limiter.record("inquiry", inquiry_key, settings.RATE_LIMIT_INQUIRY)
         
-        print(f"✅ Product inquiry submitted: ID {db_inquiry.id}")
+        print(f"✅ Product inquiry submitted: ID {db_inquiry['id']}")
         
         return db_inquiry
         
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"❌ Error: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail="Failed to submit inquiry")
 
 @router.get("/inquiries", response_model=List[ProductInquiryResponse])
 async def get_product_inquiries(
+    request: Request,
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = None,
     status: Optional[str] = None,
     product: Optional[str] = None,
-    db: Session = Depends(get_db)
+    fields: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Get all product inquiries with optional filters
+    Pass the X-Next-Cursor response header back as ?cursor= to get the next page
+    ?fields=id,name,product,status returns (and loads) only those fields
     """
-    query = db.query(ProductInquiry)
+    limit = clamp_page_size(limit)
+    try:
+        selected_fields = parse_fields(fields, ProductInquiryResponse)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
+    # Plain Core rows (no ORM objects), serialized straight to JSON below
+    query = select(*schema_columns(ProductInquiry, ProductInquiryResponse, selected_fields))
     
     if status:
-        query = query.filter(ProductInquiry.status == status)
+        query = query.where(ProductInquiry.status == status)
     if product:
-        query = query.filter(ProductInquiry.product.ilike(f"%{product}%"))
+        # Served by the trigram index on product (ix_product_inquiries_product_trgm)
+        query = query.where(ProductInquiry.product.ilike(f"%{product}%"))
+    
+    try:
+        query = paginate(query, ProductInquiry, limit, skip, cursor)
+    except ValueError as ve:
+        raise HTTPException(status_code=400, detail=str(ve))
     
-    inquiries = query.order_by(ProductInquiry.created_at.desc()).offset(skip).limit(limit).all()
-    return inquiries
+    inquiries = (await db.execute(query)).all()
+    
+    headers = {}
+    cursor_token = next_cursor(inquiries, limit)
+    if cursor_token:
+        headers["X-Next-Cursor"] = cursor_token
+    # Unchanged page -> 304 (ETag of the serialized page, no extra query)
+    return conditional_page(
+        request,
+        list_response(ProductInquiryResponse, selected_fields, inquiries, headers=headers)
+    )
 
 @router.get("/inquiries/{inquiry_id}", response_model=ProductInquiryResponse)
 async def get_product_inquiry(
+    request: Request,
+    response: Response,
     inquiry_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
-    Get specific inquiry by ID
+    Get specific inquiry by ID (If-None-Match / If-Modified-Since -> 304)
     """
-    inquiry = db.query(ProductInquiry).filter(ProductInquiry.id == inquiry_id).first()
+    if is_conditional(request):
+        validators = await probe_row(db, ProductInquiry, ProductInquiry.id == inquiry_id)
+        if validators is not None and is_not_modified(request, *validators):
+            return not_modified_response(cache_headers(*validators))
+    
+    inquiry = await db.scalar(
+        select(ProductInquiry).where(ProductInquiry.id == inquiry_id).options(undefer_group("heavy"))
+    )
     
     if not inquiry:
         raise HTTPException(
@@ -700,18 +949,21 @@ async def get_product_inquiry(
             detail="Product inquiry not found"
         )
     
+    response.headers.update(cache_headers(*row_validators(inquiry)))
     return inquiry
 
 @router.patch("/inquiries/{inquiry_id}", response_model=ProductInquiryResponse)
 async def update_product_inquiry(
     inquiry_id: int,
     inquiry_update: ProductInquiryUpdate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Update product inquiry status
     """
-    inquiry = db.query(ProductInquiry).filter(ProductInquiry.id == inquiry_id).first()
+    inquiry = await db.scalar(
+        select(ProductInquiry).where(ProductInquiry.id == inquiry_id).options(undefer_group("heavy"))
+    )
     
     if not inquiry:
         raise HTTPException(
@@ -721,24 +973,32 @@ async def update_product_inquiry(
     
     # Update fields
     update_dict = inquiry_update.dict(exclude_unset=True)
+    for field in ("status", "priority"):
+        if field in update_dict and update_dict[field] is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"{field} cannot be null"
+            )
+    if "status" in update_dict:
+        await counters.move_counter(db, counters.PRODUCT_INQUIRIES, "status", inquiry.status, update_dict["status"])
     for field, value in update_dict.items():
         setattr(inquiry, field, value)
     
     inquiry.updated_at = datetime.now()
-    db.commit()
-    db.refresh(inquiry)
+    await db.commit()
+    await invalidate_module(counters.PRODUCT_INQUIRIES)
     
     return inquiry
 
 @router.delete("/inquiries/{inquiry_id}")
 async def delete_product_inquiry(
     inquiry_id: int,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Delete product inquiry
     """
-    inquiry = db.query(ProductInquiry).filter(ProductInquiry.id == inquiry_id).first()
+    inquiry = await db.scalar(select(ProductInquiry).where(ProductInquiry.id == inquiry_id))
     
     if not inquiry:
         raise HTTPException(
@@ -746,8 +1006,14 @@ async def delete_product_inquiry(
             detail="Product inquiry not found"
         )
     
-    db.delete(inquiry)
-    db.commit()
+    await counters.bump_counters(db, counters.PRODUCT_INQUIRIES, {
+        "status": inquiry.status,
+        "product": inquiry.product,
+        "day": counters.day_bucket(inquiry.created_at)
+    }, -1)
+    await db.delete(inquiry)
+    await db.commit()
+    await invalidate_module(counters.PRODUCT_INQUIRIES)
     
     return {"message": "Product inquiry deleted successfully"}
 
@@ -757,7 +1023,7 @@ async def delete_product_inquiry(
 async def submit_free_trial_request(
     request: Request,
     trial: FreeTrialCreate, 
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     """
     Submit a free trial request - Accepts JSON body
@@ -767,14 +1033,9 @@ async def submit_free_trial_request(
         print(f"🎯 Received free trial request from: {data['name']} ({data['email']})")
         print(f"🏢 Company: {data['company']} | Interested in: {data.get('interested_in')}")
         
-        # Optional: Duplicate check
-        yesterday = datetime.now() - timedelta(days=1)
-        existing = db.query(FreeTrialRequest).filter(
-            FreeTrialRequest.email == data['email'],
-            FreeTrialRequest.created_at >= yesterday
-        ).first()
-        
-        if existing:
+        # Optional: Duplicate check (in-memory / shared counter, no DB round trip)
+        trial_key = data['email'].lower()
+        if not await rate_limiter.check("trial", trial_key, settings.RATE_LIMIT_TRIAL):
             raise HTTPException(
                 status_code=429,
                 detail="You have already requested a free trial recently."
@@ -787,30 +1048,57 @@ async def submit_free_trial_request(
             "user_agent": request.headers.get("user-agent", "")
         })
         
-        db_trial = FreeTrialRequest(
-            name=data['name'],
-            email=data['email'],
-            phone=data['phone'],
-            company=data['company'],
-            employees=data.get('employees'),
-            interested_in=data.get('interested_in'),
-            timeline=data.get('timeline'),
-            status="pending",
-            ip_address=data['ip_address'],
-            user_agent=data['user_agent'],
+        if write_behind.running:
+            accepted = await enqueue_submission(counters.FREE_TRIALS, {
+                key: data.get(key)
+                for key in ("name", "email", "phone", "company", "employees", "interested_in",
+                            "timeline", "status", "ip_address", "user_agent")
+            })
+            await rate_limiter.record("trial", trial_key, settings.RATE_LIMIT_TRIAL)
+            print(f"📥 Free trial request queued: {accepted.body.decode()}")
+            return accepted
+        
+        db_trial = await insert_returning(
+            db,
+            FreeTrialRequest,
+            {
+                "name": data['name'],
+                "email": data['email'],
+                "phone": data['phone'],
+                "company": data['company'],
+                "employees": data.get('employees'),
+                "interested_in": data.get('interested_in'),
+                "timeline": data.get('timeline'),
+                "status": "pending",
+                "ip_address": data['ip_address'],
+                "user_agent": data['user_agent'],
+            },
+            guard=under_rate(FreeTrialRequest, settings.RATE_LIMIT_TRIAL, email=data['email'])
         )
-        db.add(db_trial)
-        db.commit()
-        db.refresh(db_trial)
+        if db_trial is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=429,
+                detail="You have already requested a free trial recently."
+            )
+        
+        await counters.bump_counters(db, counters.FREE_TRIALS, {
+            "status": "pending",
+            "employees": data.get('employees'),
+            "day": counters.day_bucket(db_trial["created_at"])
+        })
+        await db.commit()
+        await invalidate_module(counters.FREE_TRIALS)
+        await rate_limiter.record("trial", trial_key, settings.RATE_LIMIT_TRIAL)
         
-        print(f"✅ Free trial request submitted: ID {db_trial.id}")
+        print(f"✅ Free trial request submitted: ID {db_trial['id']}")
         
         return db_trial
         
     except HTTPException:
         raise
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         print(f"❌ Error submitting trial: {str(e)}")
         print(traceback.format_exc())
         raise HTTPException(status_code=500, detail="Internal server error")
@@ -818,40 +1106,23 @@ async def submit_free_trial_request(
 # ==================== STATISTICS ENDPOINTS ====================
 
 @router.get("/stats/inquiries")
-async def get_product_inquiry_stats(db: Session = Depends(get_db)):
+async def get_product_inquiry_stats(db: AsyncSession = Depends(get_db)):
     """
-    Get product inquiry statistics
+    Get product inquiry statistics (from the lead_counters rollup)
     """
-    from sqlalchemy import func
-    
-    try:
-        # Total count
-        total = db.query(func.count(ProductInquiry.id)).scalar()
-        
-        # Count by status
-        by_status = db.query(
-            ProductInquiry.status,
-            func.count(ProductInquiry.id)
-        ).group_by(ProductInquiry.status).all()
-        
-        # Count by product
-        by_product = db.query(
-            ProductInquiry.product,
-            func.count(ProductInquiry.id)
-        ).group_by(ProductInquiry.product).all()
-        
-        # Recent inquiries (last 7 days)
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        recent = db.query(func.count(ProductInquiry.id)).filter(
-            ProductInquiry.created_at >= seven_days_ago
-        ).scalar()
+    async def load_stats():
+        lead_counters = await counters.read_counters(db, [counters.PRODUCT_INQUIRIES])
+        inquiry_counters = lead_counters[counters.PRODUCT_INQUIRIES]
         
         return {
-            "total": total,
-            "by_status": dict(by_status),
-            "by_product": dict(by_product),
-            "recent_7_days": recent
+            "total": sum(inquiry_counters["status"].values()),
+            "by_status": inquiry_counters["status"],
+            "by_product": inquiry_counters["product"],
+            "recent_7_days": sum(inquiry_counters["day"].values())
         }
+    
+    try:
+        return await cache.get_or_set(counters.PRODUCT_INQUIRIES, "stats", load_stats)
         
     except Exception as e:
         print(f"❌ Error fetching inquiry statistics: {str(e)}")
@@ -861,40 +1132,23 @@ async def get_product_inquiry_stats(db: Session = Depends(get_db)):
         )
 
 @router.get("/stats/trials")
-async def get_free_trial_stats(db: Session = Depends(get_db)):
+async def get_free_trial_stats(db: AsyncSession = Depends(get_db)):
     """
-    Get free trial statistics
+    Get free trial statistics (from the lead_counters rollup)
     """
-    from sqlalchemy import func
-    
-    try:
-        # Total count
-        total = db.query(func.count(FreeTrialRequest.id)).scalar()
-        
-        # Count by status
-        by_status = db.query(
-            FreeTrialRequest.status,
-            func.count(FreeTrialRequest.id)
-        ).group_by(FreeTrialRequest.status).all()
-        
-        # Count by company size (employees)
-        by_employees = db.query(
-            FreeTrialRequest.employees,
-            func.count(FreeTrialRequest.id)
-        ).filter(FreeTrialRequest.employees.isnot(None)).group_by(FreeTrialRequest.employees).all()
-        
-        # Recent trials (last 7 days)
-        seven_days_ago = datetime.now() - timedelta(days=7)
-        recent = db.query(func.count(FreeTrialRequest.id)).filter(
-            FreeTrialRequest.created_at >= seven_days_ago
-        ).scalar()
+    async def load_stats():
+        lead_counters = await counters.read_counters(db, [counters.FREE_TRIALS])
+        trial_counters = lead_counters[counters.FREE_TRIALS]
         
         return {
-            "total": total,
-            "by_status": dict(by_status),
-            "by_employees": dict(by_employees),
-            "recent_7_days": recent
+            "total": sum(trial_counters["status"].values()),
+            "by_status": trial_counters["status"],
+            "by_employees": trial_counters["employees"],
+            "recent_7_days": sum(trial_counters["day"].values())
         }
+    
+    try:
+        return await cache.get_or_set(counters.FREE_TRIALS, "stats", load_stats)
         
     except Exception as e:
         print(f"❌ Error fetching trial statistics: {str(e)}")
@@ -906,40 +1160,37 @@ async def get_free_trial_stats(db: Session = Depends(get_db)):
 # ==================== COMBINED STATISTICS ====================
 
 @router.get("/stats/overview")
-async def get_combined_stats(db: Session = Depends(get_db)):
+async def get_combined_stats(db: AsyncSession = Depends(get_db)):
     """
-    Get combined statistics for all modules
+    Get combined statistics for all modules (from the lead_counters rollup)
     """
-    from sqlalchemy import func
-    
-    try:
-        # Job Applications stats
-        job_total = db.query(func.count(JobApplication.id)).filter(
-            JobApplication.is_active == True
-        ).scalar()
+    async def load_stats():
+        lead_counters = await counters.read_counters(db, [
+            counters.JOB_APPLICATIONS,
+            counters.PROJECT_REQUESTS,
+            counters.PRODUCT_INQUIRIES,
+            counters.FREE_TRIALS
+        ])
+        job_status = lead_counters[counters.JOB_APPLICATIONS]["status"]
+        project_status = lead_counters[counters.PROJECT_REQUESTS]["status"]
+        inquiry_status = lead_counters[counters.PRODUCT_INQUIRIES]["status"]
+        trial_status = lead_counters[counters.FREE_TRIALS]["status"]
         
-        job_pending = db.query(func.count(JobApplication.id)).filter(
-            JobApplication.status == ApplicationStatus.PENDING,
-            JobApplication.is_active == True
-        ).scalar()
+        # Job Applications stats
+        job_total = sum(job_status.values())
+        job_pending = job_status.get(ApplicationStatus.PENDING.value, 0)
         
         # Project Requests stats
-        project_total = db.query(func.count(ProjectRequest.id)).scalar()
-        project_new = db.query(func.count(ProjectRequest.id)).filter(
-            ProjectRequest.status == ProjectStatus.NEW.value
-        ).scalar()
+        project_total = sum(project_status.values())
+        project_new = project_status.get(ProjectStatus.NEW.value, 0)
         
         # Product Inquiries stats
-        inquiry_total = db.query(func.count(ProductInquiry.id)).scalar()
-        inquiry_pending = db.query(func.count(ProductInquiry.id)).filter(
-            ProductInquiry.status == "pending"
-        ).scalar()
+        inquiry_total = sum(inquiry_status.values())
+        inquiry_pending = inquiry_status.get("pending", 0)
         
         # Free Trial stats
-        trial_total = db.query(func.count(FreeTrialRequest.id)).scalar()
-        trial_pending = db.query(func.count(FreeTrialRequest.id)).filter(
-            FreeTrialRequest.status == "pending"
-        ).scalar()
+        trial_total = sum(trial_status.values())
+        trial_pending = trial_status.get("pending", 0)
         
         return {
             "job_applications": {
@@ -961,6 +1212,9 @@ async def get_combined_stats(db: Session = Depends(get_db)):
             "grand_total": job_total + project_total + inquiry_total + trial_total,
             "timestamp": datetime.now().isoformat()
         }
+    
+    try:
+        return await cache.get_or_set(OVERVIEW, "stats", load_stats)
         
     except Exception as e:
         print(f"❌ Error fetching combined statistics: {str(e)}")
@@ -969,49 +1223,75 @@ async def get_combined_stats(db: Session = Depends(get_db)):
             detail=f"Error fetching combined statistics: {str(e)}"
         )
 
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """
+    Response cache hit/miss counters (for sizing CACHE_TTL_SECONDS / CACHE_MAX_ENTRIES)
+    """
+    return cache.stats()
+
 #   Contact routes
 @router.post("/contact", response_model=ContactResponse, status_code=status.HTTP_201_CREATED)
 async def submit_contact_form(
     request: Request,
     contact_data: ContactCreate,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_db)
 ):
     try:
         # Get client IP and User-Agent (for analytics/spam detection)
         client_ip = request.client.host
         user_agent = request.headers.get("user-agent")
 
-        # Rate limiting by email + IP (optional but recommended)
-        one_day_ago = datetime.utcnow() - timedelta(days=1)
-        recent_count = db.query(ContactInquiry).filter(
-            ContactInquiry.email == contact_data.email,
-            ContactInquiry.ip_address == client_ip,
-            ContactInquiry.created_at >= one_day_ago
-        ).count()
-
-        if recent_count >= 5:  # Max 5 messages per day per email+IP
+        # Rate limiting by email + IP (in-memory / shared counter, no DB round trip)
+        contact_key = f"{contact_data.email.lower()}:{client_ip}"
+        if not await rate_limiter.check("contact", contact_key, settings.RATE_LIMIT_CONTACT):
             raise HTTPException(
                 status_code=429,
                 detail="Too many requests. Please try again tomorrow."
             )
 
-        # Create new inquiry
-        new_inquiry = ContactInquiry(
-            name=contact_data.name,
-            email=contact_data.email,
-            phone=contact_data.phone,
-            subject=ContactSubject(contact_data.subject),
-            message=contact_data.message,
-            ip_address=client_ip,
-            user_agent=user_agent,
+        if write_behind.running:
+            accepted = await enqueue_submission(counters.CONTACT_INQUIRIES, {
+                "name": contact_data.name,
+                "email": contact_data.email,
+                "phone": contact_data.phone,
+                "subject": ContactSubject(contact_data.subject),
+                "message": contact_data.message,
+                "ip_address": client_ip,
+                "user_agent": user_agent,
+            })
+            await rate_limiter.record("contact", contact_key, settings.RATE_LIMIT_CONTACT)
+            return accepted
+
+        # Create new inquiry (limit re-checked and row returned in the same statement)
+        new_inquiry = await insert_returning(
+            db,
+            ContactInquiry,
+            {
+                "name": contact_data.name,
+                "email": contact_data.email,
+                "phone": contact_data.phone,
+                "subject": ContactSubject(contact_data.subject),
+                "message": contact_data.message,
+                "ip_address": client_ip,
+                "user_agent": user_agent,
+            },
+            guard=under_rate(ContactInquiry, settings.RATE_LIMIT_CONTACT, email=contact_data.email, ip_address=client_ip)
         )
+        if new_inquiry is None:
+            await db.rollback()
+            raise HTTPException(
+                status_code=429,
+                detail="Too many requests. Please try again tomorrow."
+            )
 
-        db.add(new_inquiry)
-        db.commit()
-        db.refresh(new_inquiry)
+        await db.commit()
+        await rate_limiter.record("contact", contact_key, settings.RATE_LIMIT_CONTACT)
 
         return new_inquiry
 
+    except HTTPException:
+        raise
     except ValueError as ve:
         raise HTTPException(status_code=400, detail=str(ve))
     except Exception as e:
@@ -0,0 +1,216 @@
+"""
+Admin search: full-text search across applications, projects, contact messages
+and product inquiries, plus autocomplete for the search box
+
+Each table has a generated, GIN-indexed search_vector column (names/titles
+weighted above free text). Matches of every selected table are ranked with
+ts_rank and paged with a (rank, type, id) keyset cursor; snippets are built
+with ts_headline for the rows of the returned page only.
+
+Autocomplete matches names, emails, companies and products by prefix or
+trigram similarity; both are served by the pg_trgm GIN indexes.
+"""
+from typing import Optional
+from fastapi import APIRouter, HTTPException, Query, Response, Depends
+from sqlalchemy import String, and_, cast, func, literal, literal_column, or_, select, tuple_, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.database import get_db
+from app.core.pagination import clamp_page_size, decode_token, encode_token
+from app.core.cache import cache, OVERVIEW
+from app.models.job_application import JobApplication
+from app.models.project_request import ProjectRequest
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+from app.models.contact import ContactInquiry
+
+router = APIRouter()
+
+# Text search configuration of the search_vector columns
+SEARCH_CONFIG = literal_column("'english'::regconfig")
+
+HEADLINE_OPTIONS = "StartSel=<mark>, StopSel=</mark>, MaxFragments=2, MaxWords=25, MinWords=8"
+
+# Result type -> (model, public key, title, searched text, extra condition)
+SEARCH_SOURCES = {
+    "applications": (
+        JobApplication,
+        JobApplication.application_id,
+        func.concat_ws(" - ", JobApplication.full_name, JobApplication.job_title),
+        JobApplication.cover_letter,
+        JobApplication.is_active == True,
+    ),
+    "projects": (
+        ProjectRequest,
+        ProjectRequest.project_id,
+        func.concat_ws(" - ", ProjectRequest.full_name, ProjectRequest.project_type),
+        ProjectRequest.description,
+        None,
+    ),
+    "contacts": (
+        ContactInquiry,
+        cast(ContactInquiry.id, String),
+        ContactInquiry.name,
+        ContactInquiry.message,
+        None,
+    ),
+    "inquiries": (
+        ProductInquiry,
+        cast(ProductInquiry.id, String),
+        func.concat_ws(" - ", ProductInquiry.name, ProductInquiry.product),
+        ProductInquiry.message,
+        None,
+    ),
+}
+
+# Autocomplete field -> columns it suggests values from
+AUTOCOMPLETE_FIELDS = {
+    "product": [ProductInquiry.product],
+    "company": [ProductInquiry.company, FreeTrialRequest.company, ProjectRequest.company],
+    "name": [
+        ProductInquiry.name,
+        FreeTrialRequest.name,
+        ContactInquiry.name,
+        ProjectRequest.full_name,
+        JobApplication.full_name,
+    ],
+    "email": [
+        ProductInquiry.email,
+        FreeTrialRequest.email,
+        ContactInquiry.email,
+        ProjectRequest.email,
+        JobApplication.email,
+    ],
+}
+
+MAX_SUGGESTIONS = 20
+
+def _matches(result_type: str, query):
+    model, key, title, body, condition = SEARCH_SOURCES[result_type]
+    matches = select(
+        literal(result_type, String).label("type"),
+        model.id.label("id"),
+        key.label("key"),
+        title.label("title"),
+        body.label("body"),
+        model.created_at.label("created_at"),
+        func.ts_rank(model.search_vector, query).label("rank"),
+    ).where(model.search_vector.op("@@")(query))
+
+    if condition is not None:
+        matches = matches.where(condition)
+    return matches
+
+@router.get("/search")
+async def search(
+    response: Response,
+    q: str = Query(..., min_length=2, max_length=200),
+    types: Optional[str] = None,
+    limit: int = 20,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Ranked full-text search (web search syntax: "exact phrase", -exclude, or)
+    types: comma-separated subset of applications, projects, contacts, inquiries
+    Pass the X-Next-Cursor response header back as ?cursor= to get the next page
+    """
+    limit = clamp_page_size(limit)
+    selected = [t.strip() for t in types.split(",") if t.strip()] if types else list(SEARCH_SOURCES)
+    unknown = [t for t in selected if t not in SEARCH_SOURCES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown search type: {', '.join(unknown)}. Available: {', '.join(SEARCH_SOURCES)}"
+        )
+
+    query = func.websearch_to_tsquery(SEARCH_CONFIG, q)
+    matches = union_all(*[_matches(result_type, query) for result_type in selected]).subquery()
+
+    page = select(matches)
+    if cursor:
+        try:
+            rank, result_type, row_id = decode_token(cursor)
+        except ValueError as ve:
+            raise HTTPException(status_code=400, detail=str(ve))
+        page = page.where(or_(
+            matches.c.rank < rank,
+            and_(matches.c.rank == rank, tuple_(matches.c.type, matches.c.id) > (result_type, row_id))
+        ))
+    page = page.order_by(matches.c.rank.desc(), matches.c.type, matches.c.id).limit(limit).subquery()
+
+    # Highlight only the rows of this page
+    results = (await db.execute(
+        select(
+            page.c.type,
+            page.c.id,
+            page.c.key,
+            page.c.title,
+            page.c.created_at,
+            page.c.rank,
+            func.ts_headline(SEARCH_CONFIG, func.coalesce(page.c.body, ""), query, HEADLINE_OPTIONS).label("highlight"),
+        ).order_by(page.c.rank.desc(), page.c.type, page.c.id)
+    )).mappings().all()
+
+    if len(results) == limit:
+        last = results[-1]
+        response.headers["X-Next-Cursor"] = encode_token([last["rank"], last["type"], last["id"]])
+
+    return [dict(result) for result in results]
+
+def _suggestions(column, q: str, limit: int):
+    """
+    Best values of one column: prefix matches first, then by trigram similarity
+    """
+    prefix = q.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+    is_prefix = column.ilike(prefix)
+    score = func.similarity(column, q)
+
+    return select(
+        column.label("value"),
+        score.label("score"),
+        is_prefix.label("prefix"),
+    ).where(or_(is_prefix, column.op("%")(q))).order_by(is_prefix.desc(), score.desc()).limit(limit).subquery()
+
+async def query_suggestions(db: AsyncSession, field: str, q: str, limit: int):
+    """
+    Top values of an autocomplete field for q (uncached)
+    """
+    branches = [_suggestions(column, q, limit) for column in AUTOCOMPLETE_FIELDS[field]]
+    candidates = union_all(*[select(branch) for branch in branches]).subquery()
+
+    best_prefix = func.bool_or(candidates.c.prefix)
+    best_score = func.max(candidates.c.score)
+    rows = await db.execute(
+        select(candidates.c.value, best_score, best_prefix)
+        .group_by(candidates.c.value)
+        .order_by(best_prefix.desc(), best_score.desc(), candidates.c.value)
+        .limit(limit)
+    )
+    return [
+        {"value": value, "score": round(score, 4), "prefix": prefix}
+        for value, score, prefix in rows
+    ]
+
+@router.get("/autocomplete")
+async def autocomplete(
+    field: str = Query(..., pattern="^(product|company|name|email)$"),
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = 10,
+    db: AsyncSession = Depends(get_db)
+):
+    """
+    Top matching values of a field across the lead tables (admin search box)
+    """
+    limit = max(1, min(limit, MAX_SUGGESTIONS))
+    q = q.strip()
+
+    async def load_suggestions():
+        return await query_suggestions(db, field, q, limit)
+
+    # Per-keystroke lookups repeat a lot; short TTL, dropped on any lead write
+    return await cache.get_or_set(
+        OVERVIEW,
+        f"autocomplete:{field}:{q.lower()}:{limit}",
+        load_suggestions,
+        ttl=settings.AUTOCOMPLETE_CACHE_TTL_SECONDS
+    )
@@ -0,0 +1,67 @@
+"""
+Request body size limits for the upload endpoints
+
+Starlette parses a multipart body completely (spooling file parts to temporary
+files) before the handler runs, so the per-file limits checked while streaming
+an UploadFile into the store (save_upload_stream) only apply once the whole body
+has been received. RequestBodyLimitMiddleware caps the body itself, per path
+(settings.REQUEST_BODY_LIMITS): a declared Content-Length over the limit is
+answered 413 before anything is read, and the bytes actually received are
+counted so a chunked or lying client is cut off at the limit.
+
+Bodies under the limit are still spooled once by Starlette and then copied into
+the store, i.e. written to disk twice; the cap bounds that work, it does not
+remove it.
+"""
+import json
+from fastapi import HTTPException, status
+from app.core.config import settings
+
+class RequestBodyLimitMiddleware:
+    """
+    ASGI middleware: 413 for request bodies over the configured limit of their path
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        limit = settings.REQUEST_BODY_LIMITS.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > limit:
+            await self._reject(send, limit)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside request.form(); FastAPI passes HTTPException through
+                    raise HTTPException(
+                        status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE,
+                        detail=f"Request body too large. Maximum size: {limit / 1024 / 1024:.1f}MB"
+                    )
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+    async def _reject(self, send, limit: int):
+        body = json.dumps({"detail": f"Request body too large. Maximum size: {limit / 1024 / 1024:.1f}MB"}).encode()
+        await send({
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [
+                (b"content-type", b"application/json"),
+                (b"content-length", str(len(body)).encode()),
+                # Tell the client not to keep sending the (unread) body
+                (b"connection", b"close"),
+            ],
+        })
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,247 @@
+"""
+Bulk import of historical leads (COPY FROM STDIN)
+
+The source file (CSV with a header row, or NDJSON) is read a batch at a time
+in a worker thread. Each record is validated with the same schema as the
+matching public endpoint, valid rows are loaded with asyncpg's
+copy_records_to_table and counted in lead_counters, and the batch is
+committed. Rejected records go to an NDJSON report (line, errors, record),
+so neither the file nor the rejects are ever held in memory. Lines that are
+not valid UTF-8 and rows the CSV reader cannot parse are rejected the same
+way, one record at a time, so a bad line deep in the file does not abort an
+import whose earlier batches are already committed.
+
+A created_at value in the source is kept (historical leads); otherwise the
+import time is used. status and source are kept too where the table has
+them, defaulting to "pending" / "import". Strings longer than their column
+are rejected per record before COPY.
+"""
+import asyncio
+import codecs
+import csv
+import enum
+import itertools
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Any, BinaryIO, Dict, Iterator, List, Set, Tuple
+import aiofiles
+import aiofiles.os
+from pydantic import ValidationError
+from sqlalchemy import Enum
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core import counters
+from app.core.cache import invalidate_module
+from app.models.contact import ContactInquiry, ContactSubject
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+from app.schemas.contact import ContactCreate
+from app.schemas.product_inquiry import ProductInquiryCreate, FreeTrialCreate
+
+# Dataset name -> (model, validation schema, counters module)
+IMPORTABLE = {
+    "contacts": (ContactInquiry, ContactCreate, counters.CONTACT_INQUIRIES),
+    "inquiries": (ProductInquiry, ProductInquiryCreate, counters.PRODUCT_INQUIRIES),
+    "trials": (FreeTrialRequest, FreeTrialCreate, counters.FREE_TRIALS),
+}
+
+# Bookkeeping fields the public schemas do not accept: taken from the source
+# record when it has them (historical status / origin), IMPORT_DEFAULTS otherwise
+PASSTHROUGH_FIELDS = ("status", "source")
+IMPORT_DEFAULTS = {
+    "status": "pending",
+    "source": "import",
+}
+
+# Rejected records returned inline by the API (the report has all of them)
+REJECTED_SAMPLE_SIZE = 20
+
+class ImportRecordError(ValueError):
+    """
+    A record that passed schema validation but does not fit the table
+    """
+    def __init__(self, errors: List[Dict[str, Any]]):
+        self.errors = errors
+        super().__init__("; ".join(error["msg"] for error in errors))
+
+def _decoded_lines(source: BinaryIO, bad_lines: Set[int]) -> Iterator[str]:
+    """
+    Lines of the binary source as text, decoded one at a time; the numbers of lines
+    that are not valid UTF-8 are added to bad_lines (and decoded with replacements)
+    """
+    for line_number, raw in enumerate(source, 1):
+        if line_number == 1:
+            raw = raw.removeprefix(codecs.BOM_UTF8)
+        try:
+            yield raw.decode("utf-8")
+        except UnicodeDecodeError:
+            bad_lines.add(line_number)
+            yield raw.decode("utf-8", errors="replace")
+
+def _read_records(source: BinaryIO, file_format: str) -> Iterator[Tuple[int, Any]]:
+    """
+    (line number, record) per source record; records that cannot be decoded or
+    parsed are returned as an Exception instead of a dict
+    """
+    bad_lines: Set[int] = set()
+    lines = _decoded_lines(source, bad_lines)
+
+    if file_format == "csv":
+        reader = csv.DictReader(lines)
+        reader.fieldnames  # header row (an unreadable header fails the whole import)
+        while True:
+            first_line = reader.line_num + 1
+            try:
+                record = next(reader)
+            except StopIteration:
+                return
+            except csv.Error as e:
+                # The reader resumes with the next line (line_num is not advanced on errors)
+                yield first_line, ValueError(f"Unreadable CSV row: {e}")
+                continue
+            if bad_lines.intersection(range(first_line, reader.line_num + 1)):
+                yield reader.line_num, ValueError("Row is not valid UTF-8")
+                continue
+            # Empty CSV cells mean "not given"
+            yield reader.line_num, {key: (value if value != "" else None) for key, value in record.items()}
+
+    for line_number, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        if line_number in bad_lines:
+            yield line_number, ValueError("Line is not valid UTF-8")
+            continue
+        try:
+            record = json.loads(line)
+            if not isinstance(record, dict):
+                raise ValueError("Expected a JSON object")
+            yield line_number, record
+        except ValueError as e:
+            yield line_number, e
+
+def _created_at(record: Dict[str, Any]) -> datetime:
+    value = record.get("created_at")
+    if not value:
+        return datetime.now(timezone.utc)
+    created_at = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    return created_at if created_at.tzinfo else created_at.replace(tzinfo=timezone.utc)
+
+def _copy_value(column, value):
+    """
+    Value as COPY expects it: python-side defaults applied, enums by label
+    """
+    if value is None and column.default is not None and column.default.is_scalar:
+        value = column.default.arg
+    if isinstance(value, enum.Enum) and isinstance(column.type, Enum):
+        return value.name
+    return value
+
+def _length_errors(columns, values: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Validation errors for strings longer than their column (COPY would abort the whole batch)
+    """
+    errors = []
+    for column in columns:
+        length = getattr(column.type, "length", None)
+        value = values.get(column.name)
+        if length and isinstance(value, str) and len(value) > length:
+            errors.append({
+                "type": "string_too_long",
+                "loc": [column.name],
+                "msg": f"String should have at most {length} characters",
+                "input": value,
+            })
+    return errors
+
+def detect_format(filename: str) -> str:
+    """
+    "ndjson" for .ndjson / .jsonl / .json files, "csv" otherwise
+    """
+    return "ndjson" if filename.lower().endswith((".ndjson", ".jsonl", ".json")) else "csv"
+
+async def import_leads(db: AsyncSession, dataset: str, source: BinaryIO, file_format: str) -> Dict[str, Any]:
+    """
+    Import every valid record of source into dataset and write the rejected-rows report
+    """
+    _, _, module = IMPORTABLE[dataset]
+
+    await aiofiles.os.makedirs(settings.IMPORT_REPORT_DIR, exist_ok=True)
+    report_path = settings.IMPORT_REPORT_DIR / f"{dataset}-{datetime.now().strftime('%Y%m%d-%H%M%S')}-{uuid.uuid4().hex[:8]}.ndjson"
+
+    records = _read_records(source, file_format)
+    stats = {"imported": 0, "rejected": 0, "rejected_sample": []}
+
+    try:
+        async with aiofiles.open(report_path, "w") as report:
+            await _import_batches(db, dataset, records, report, stats)
+    finally:
+        # The caller owns (and closes) the source file
+        if stats["imported"]:
+            await invalidate_module(module)
+
+    return {
+        "dataset": dataset,
+        "imported": stats["imported"],
+        "rejected": stats["rejected"],
+        "report": str(report_path),
+        "rejected_sample": json.loads(json.dumps(stats["rejected_sample"], default=str))
+    }
+
+async def _import_batches(db: AsyncSession, dataset: str, records: Iterator[Tuple[int, Any]], report, stats: Dict[str, Any]):
+    model, schema, module = IMPORTABLE[dataset]
+    columns = [column for column in model.__table__.c if column.name != "id" and column.computed is None]
+
+    while True:
+        batch = await asyncio.to_thread(lambda: list(itertools.islice(records, settings.IMPORT_BATCH_SIZE)))
+        if not batch:
+            return
+
+        leads: List[Dict[str, Any]] = []
+        for line_number, record in batch:
+            try:
+                if isinstance(record, Exception):
+                    raise record
+                values = {
+                    **IMPORT_DEFAULTS,
+                    **schema.model_validate(record).model_dump(),
+                    **{name: str(record[name]).strip() for name in PASSTHROUGH_FIELDS if record.get(name) not in (None, "")}
+                }
+                values["created_at"] = _created_at(record)
+                if dataset == "contacts":
+                    values["subject"] = ContactSubject(values["subject"])
+                errors = _length_errors(columns, values)
+                if errors:
+                    raise ImportRecordError(errors)
+                leads.append(values)
+            except (ValidationError, ImportRecordError, ValueError) as e:
+                if isinstance(e, ValidationError):
+                    errors = e.errors(include_url=False)
+                elif isinstance(e, ImportRecordError):
+                    errors = e.errors
+                else:
+                    errors = [{"msg": str(e)}]
+                entry = {"line": line_number, "errors": errors, "record": None if isinstance(record, Exception) else record}
+                await report.write(json.dumps(entry, default=str) + "\n")
+                stats["rejected"] += 1
+                if len(stats["rejected_sample"]) < REJECTED_SAMPLE_SIZE:
+                    stats["rejected_sample"].append(entry)
+
+        if not leads:
+            continue
+
+        # COPY on the session's own connection, so rows and counters commit together
+        connection = await db.connection()
+        copy_connection = (await connection.get_raw_connection()).driver_connection
+        await copy_connection.copy_records_to_table(
+            model.__tablename__,
+            records=[
+                tuple(_copy_value(column, values.get(column.name)) for column in columns)
+                for values in leads
+            ],
+            columns=[column.name for column in columns]
+        )
+        await counters.bump_counters_bulk(db, module, leads)
+        await db.commit()
+
+        stats["imported"] += len(leads)
+        print(f"📥 Imported {stats['imported']} {dataset} ({stats['rejected']} rejected)")
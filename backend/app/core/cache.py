@@ -0,0 +1,153 @@
+"""
+Response cache for stats and lookup endpoints
+
+Entries expire after a TTL and the in-process backend evicts least recently
+used entries beyond CACHE_MAX_ENTRIES. Keys are grouped in namespaces (one per
+lead module); write handlers call invalidate_module() after committing, which
+bumps the namespace generation so every older entry is ignored. With
+CACHE_BACKEND=redis the entries and generations are shared by all workers.
+"""
+import json
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Optional
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # optional dependency, only needed for CACHE_BACKEND=redis
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+# Namespace of endpoints that aggregate every module (invalidated with any module)
+OVERVIEW = "overview"
+
+class MemoryCacheBackend:
+    """
+    In-process TTL + LRU store
+    """
+    name = "memory"
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+    async def get(self, key: str) -> Optional[Any]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def generation(self, namespace: str) -> int:
+        return self._generations.get(namespace, 0)
+
+    async def bump_generation(self, namespace: str):
+        self._generations[namespace] = self._generations.get(namespace, 0) + 1
+
+    def size(self) -> int:
+        return len(self._entries)
+
+class RedisCacheBackend:
+    """
+    Shared store for multi-worker deployments (values are stored as JSON)
+    """
+    name = "redis"
+
+    def __init__(self, url: str):
+        self._redis = redis_asyncio.from_url(url)
+
+    async def get(self, key: str) -> Optional[Any]:
+        raw = await self._redis.get(f"cache:{key}")
+        return json.loads(raw) if raw is not None else None
+
+    async def set(self, key: str, value: Any, ttl: int):
+        await self._redis.set(f"cache:{key}", json.dumps(value, default=str), ex=ttl)
+
+    async def generation(self, namespace: str) -> int:
+        return int(await self._redis.get(f"cache-gen:{namespace}") or 0)
+
+    async def bump_generation(self, namespace: str):
+        await self._redis.incr(f"cache-gen:{namespace}")
+
+    def size(self) -> Optional[int]:
+        return None
+
+class ResponseCache:
+    """
+    Namespaced get-or-compute cache with hit/miss counters
+    """
+    def __init__(self, backend, ttl: int):
+        self.backend = backend
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+
+    async def get_or_set(self, namespace: str, key: str, factory: Callable[[], Awaitable[Any]], ttl: Optional[int] = None) -> Any:
+        """
+        Return the cached value of namespace/key or compute and store it with factory()
+        """
+        generation = await self.backend.generation(namespace)
+        cache_key = f"{namespace}:{generation}:{key}"
+
+        value = await self.backend.get(cache_key)
+        if value is not None:
+            self.hits += 1
+            return value
+
+        self.misses += 1
+        value = await factory()
+        await self.backend.set(cache_key, value, ttl or self.ttl)
+        return value
+
+    async def invalidate(self, namespace: str):
+        """
+        Drop every entry of a namespace
+        """
+        await self.backend.bump_generation(namespace)
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "backend": self.backend.name,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            "entries": self.backend.size(),
+            "max_entries": settings.CACHE_MAX_ENTRIES,
+            "ttl_seconds": self.ttl
+        }
+
+def build_backend():
+    """
+    Backend selected by settings.CACHE_BACKEND (falls back to memory)
+    """
+    if settings.CACHE_BACKEND == "redis":
+        if redis_asyncio is not None and settings.REDIS_URL:
+            return RedisCacheBackend(settings.REDIS_URL)
+        logger.warning("CACHE_BACKEND=redis but redis is not installed or REDIS_URL is not set, using memory cache")
+    return MemoryCacheBackend(settings.CACHE_MAX_ENTRIES)
+
+cache = ResponseCache(build_backend(), settings.CACHE_TTL_SECONDS)
+
+async def invalidate_module(module: str):
+    """
+    Invalidate a module's cached stats/lookups plus the combined overview
+    """
+    await cache.invalidate(module)
+    await cache.invalidate(OVERVIEW)
@@ -1,5 +1,5 @@
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import List, Optional, Dict
 import os
 from pathlib import Path
 
@@ -11,6 +11,8 @@ class Settings(BaseSettings):
     
     # Database
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 10
     
     # CORS
     FRONTEND_URL: str = "http://localhost:5173"
@@ -25,13 +27,57 @@ class Settings(BaseSettings):
     MAX_UPLOAD_SIZE: int = 5242880  # 5MB
     ALLOWED_FILE_TYPES_STR:str = ".pdf, .doc, .docx"
     ALLOWED_IMAGE_TYPES_STR: str = ".jpg,.jpeg,.png,.gif,.webp"
+    ALLOWED_PROJECT_FILE_TYPES_STR: str = ".pdf,.doc,.docx,.xls,.xlsx,.txt,.jpg,.jpeg,.png,.gif"
     UPLOAD_DIR: Path = Path("./uploads")
     MAX_FILE_NAME_LENGTH: int = 255
+    MAX_PROJECT_FILE_SIZE: int = 10485760  # 10MB per project attachment
+    MAX_PROJECT_REQUEST_SIZE: int = 52428800  # 50MB per /projects/submit body (all attachments)
+    MAX_FORM_FIELDS_SIZE: int = 1048576  # 1MB allowance for the non-file fields of an upload form
+    UPLOAD_CHUNK_SIZE: int = 65536  # 64KB read/write buffer for streamed uploads
+    PROJECT_UPLOAD_CONCURRENCY: int = 4  # Attachments processed in parallel per request
+    UPLOAD_SNIFF_BYTES: int = 8192  # Leading bytes of an upload used to detect its real type
+    FILE_OFFLOAD: str = "none"  # none, x-accel-redirect (nginx) or x-sendfile (Apache / lighttpd)
+    FILE_OFFLOAD_PREFIX: str = "/protected-uploads"  # Internal proxy location mapped to UPLOAD_DIR (x-accel-redirect)
     
     # Application Settings
-    MAX_APPLICATIONS_PER_DAY: int = 3  # Prevent spam
+    MAX_APPLICATIONS_PER_DAY: int = 3  # Prevent spam (per email)
+    
+    # Rate limiting ("<count>/<second|minute|hour|day>")
+    RATE_LIMIT_BACKEND: str = "memory"  # memory or redis (uses REDIS_URL)
+    RATE_LIMIT_MAX_KEYS: int = 100000  # Memory backend bound
+    RATE_LIMIT_CONTACT: str = "5/day"  # per email + IP
+    RATE_LIMIT_INQUIRY: str = "1/day"  # per email + product
+    RATE_LIMIT_TRIAL: str = "1/day"  # per email
+    # Per client IP, checked before the request body is read
+    RATE_LIMITS_PER_IP: Dict[str, str] = {
+        "/api/v1/apply": "20/hour",
+        "/api/v1/projects/submit": "20/hour",
+        "/api/v1/contact": "30/hour",
+        "/api/v1/inquiries/submit": "30/hour",
+        "/api/v1/trial": "30/hour",
+    }
     DEFAULT_PAGE_SIZE: int = 20
+    MAX_PAGE_SIZE: int = 100  # Hard cap for list endpoints
+    EXPORT_BATCH_SIZE: int = 1000  # Rows fetched per server-side cursor round trip in exports
+    IMPORT_BATCH_SIZE: int = 5000  # Rows validated and COPY'd per transaction in bulk imports
+    IMPORT_REPORT_DIR: Path = Path("./import_reports")  # Rejected-rows reports of bulk imports
     
+    # Response cache (stats / lookup endpoints)
+    CACHE_BACKEND: str = "memory"  # memory or redis
+    CACHE_TTL_SECONDS: int = 30
+    AUTOCOMPLETE_CACHE_TTL_SECONDS: int = 10  # Per-keystroke suggestions go stale quickly
+    CACHE_MAX_ENTRIES: int = 1024
+    REDIS_URL: Optional[str] = None  # Shared backend for multi-worker deployments
+
+    # Write-behind queue for /contact, /trial, /inquiries/submit (202 + batched inserts)
+    WRITE_BEHIND_ENABLED: bool = False
+    WRITE_BEHIND_BATCH_SIZE: int = 500  # Max leads per flush
+    WRITE_BEHIND_FLUSH_INTERVAL_MS: int = 200  # Max wait before a partial batch is flushed
+    WRITE_BEHIND_MAX_QUEUE: int = 10000  # Queued leads before submissions get 503
+    WRITE_BEHIND_ENQUEUE_TIMEOUT_MS: int = 100  # Wait for a free slot before 503
+    WRITE_BEHIND_DRAIN_TIMEOUT_S: int = 30  # Max time to flush the queue on shutdown
+    WRITE_BEHIND_DEAD_LETTER_PATH: Path = Path("./write_behind_failed.ndjson")
+
  # Parsed properties (getters)
     @property
     def ALLOWED_FILE_TYPES(self) -> List[str]:
@@ -41,6 +87,24 @@ class Settings(BaseSettings):
     def ALLOWED_IMAGE_TYPES(self) -> List[str]:
         return [ext.strip() for ext in self.ALLOWED_IMAGE_TYPES_STR.split(",") if ext.strip()]
     
+    @property
+    def ALLOWED_PROJECT_FILE_TYPES(self) -> List[str]:
+        return [ext.strip() for ext in self.ALLOWED_PROJECT_FILE_TYPES_STR.split(",") if ext.strip()]
+    
+    @property
+    def REQUEST_BODY_LIMITS(self) -> Dict[str, int]:
+        # Whole request body per upload endpoint, enforced before multipart parsing
+        return {
+            "/api/v1/apply": self.MAX_UPLOAD_SIZE + self.MAX_FORM_FIELDS_SIZE,
+            "/api/v1/projects/submit": self.MAX_PROJECT_REQUEST_SIZE + self.MAX_FORM_FIELDS_SIZE,
+        }
+
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        # Same database, asyncpg driver (postgresql://... -> postgresql+asyncpg://...)
+        scheme, _, rest = self.DATABASE_URL.partition("://")
+        return f"{scheme.split('+')[0]}+asyncpg://{rest}"
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -49,7 +113,3 @@ class Settings(BaseSettings):
 
 settings = Settings()
 
-# Create directories if they don't exist
-settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-(settings.UPLOAD_DIR / "resumes").mkdir(parents=True, exist_ok=True)
-(settings.UPLOAD_DIR / "images").mkdir(parents=True, exist_ok=True)
\ No newline at end of file
@@ -0,0 +1,180 @@
+"""
+Lead counters - rollup table behind the stats endpoints
+
+Every insert / status change / delete of a lead updates lead_counters in the
+same transaction, so stats read a handful of counter rows instead of counting
+the lead tables. Day buckets are UTC dates on every path (live updates,
+rebuild_counters() and the 0002 backfill), whatever the app's or the database
+session's time zone. rebuild_counters() recomputes everything from scratch to
+correct drift (see rebuild_counters.py).
+"""
+import enum
+from collections import Counter, defaultdict
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+from sqlalchemy import select, delete, func, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.lead_counter import LeadCounter
+from app.models.job_application import JobApplication
+from app.models.project_request import ProjectRequest
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+
+JOB_APPLICATIONS = "job_applications"
+PROJECT_REQUESTS = "project_requests"
+PRODUCT_INQUIRIES = "product_inquiries"
+FREE_TRIALS = "free_trials"
+CONTACT_INQUIRIES = "contact_inquiries"  # not counted, used as a module name elsewhere
+
+# Days kept in the "recent" window of the stats endpoints (today included)
+RECENT_DAYS = 7
+
+def _bucket(value) -> Optional[str]:
+    """
+    Counter bucket for a column value (enums are stored by value)
+    """
+    if value is None:
+        return None
+    if isinstance(value, enum.Enum):
+        return str(value.value)
+    return str(value)[:200]
+
+def day_bucket(moment: Optional[datetime] = None) -> str:
+    """
+    Bucket of the "day" dimension for a timestamp (defaults to now): its UTC date
+    Naive timestamps are taken as UTC.
+    """
+    if moment is None:
+        moment = datetime.now(timezone.utc)
+    elif moment.tzinfo is not None:
+        moment = moment.astimezone(timezone.utc)
+    return moment.date().isoformat()
+
+def _utc_date(column):
+    # SQL counterpart of day_bucket(): the UTC date of a timestamptz column
+    return func.date(func.timezone("UTC", column))
+
+def lead_buckets(module: str, values: Dict[str, object]) -> Dict[str, object]:
+    """
+    {dimension: value} counted for a new lead of a module, from its column values
+    """
+    if module in (JOB_APPLICATIONS, PROJECT_REQUESTS):
+        return {"status": values.get("status")}
+    if module == PRODUCT_INQUIRIES:
+        return {
+            "status": values.get("status"),
+            "product": values.get("product"),
+            "day": day_bucket(values.get("created_at"))
+        }
+    if module == FREE_TRIALS:
+        return {
+            "status": values.get("status"),
+            "employees": values.get("employees"),
+            "day": day_bucket(values.get("created_at"))
+        }
+    return {}
+
+async def bump_counters(db: AsyncSession, module: str, buckets: Dict[str, object], delta: int = 1):
+    """
+    Add delta to the counter of each {dimension: value} of a lead (part of the caller's transaction)
+    """
+    await _upsert_counters(db, module, {
+        (dimension, _bucket(value)): delta
+        for dimension, value in buckets.items()
+        if _bucket(value) is not None
+    })
+
+async def bump_counters_bulk(db: AsyncSession, module: str, leads: List[Dict[str, object]]):
+    """
+    Count a batch of new leads (column values) with a single upsert
+    """
+    totals = Counter()
+    for values in leads:
+        for dimension, value in lead_buckets(module, values).items():
+            if _bucket(value) is not None:
+                totals[(dimension, _bucket(value))] += 1
+    await _upsert_counters(db, module, totals)
+
+async def _upsert_counters(db: AsyncSession, module: str, deltas: Dict[Tuple[str, str], int]):
+    # Sorted, so concurrent upserts lock the counter rows in the same order (no deadlocks)
+    rows = [
+        {"module": module, "dimension": dimension, "bucket": bucket, "count": delta}
+        for (dimension, bucket), delta in sorted(deltas.items())
+    ]
+    if not rows:
+        return
+
+    stmt = insert(LeadCounter).values(rows)
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[LeadCounter.module, LeadCounter.dimension, LeadCounter.bucket],
+            set_={"count": LeadCounter.count + stmt.excluded.count, "updated_at": func.now()}
+        )
+    )
+
+async def move_counter(db: AsyncSession, module: str, dimension: str, old_value, new_value):
+    """
+    Move one lead from one bucket to another, e.g. on a status PATCH
+    """
+    old_bucket, new_bucket = _bucket(old_value), _bucket(new_value)
+    if old_bucket == new_bucket:
+        return
+
+    # One statement for both buckets: A->B and B->A moves lock them in the same order
+    deltas = {}
+    if old_bucket is not None:
+        deltas[(dimension, old_bucket)] = -1
+    if new_bucket is not None:
+        deltas[(dimension, new_bucket)] = 1
+    await _upsert_counters(db, module, deltas)
+
+async def read_counters(db: AsyncSession, modules: Iterable[str]) -> Dict[str, Dict[str, Dict[str, int]]]:
+    """
+    Counters of the given modules as {module: {dimension: {bucket: count}}}
+    Day buckets outside the recent window are not read.
+    """
+    oldest_day = (datetime.now(timezone.utc).date() - timedelta(days=RECENT_DAYS - 1)).isoformat()
+
+    result = await db.execute(
+        select(LeadCounter.module, LeadCounter.dimension, LeadCounter.bucket, LeadCounter.count).where(
+            LeadCounter.module.in_(list(modules)),
+            (LeadCounter.dimension != "day") | (LeadCounter.bucket >= oldest_day)
+        )
+    )
+
+    counters = defaultdict(lambda: defaultdict(dict))
+    for module, dimension, bucket, count in result:
+        if count:
+            counters[module][dimension][bucket] = count
+    return counters
+
+async def rebuild_counters(db: AsyncSession):
+    """
+    Recompute all counters from the lead tables (drift correction)
+    """
+    sources = [
+        (JOB_APPLICATIONS, "status", JobApplication, JobApplication.status, JobApplication.is_active == True),
+        (PROJECT_REQUESTS, "status", ProjectRequest, ProjectRequest.status, None),
+        (PRODUCT_INQUIRIES, "status", ProductInquiry, ProductInquiry.status, None),
+        (PRODUCT_INQUIRIES, "product", ProductInquiry, ProductInquiry.product, None),
+        (PRODUCT_INQUIRIES, "day", ProductInquiry, _utc_date(ProductInquiry.created_at), None),
+        (FREE_TRIALS, "status", FreeTrialRequest, FreeTrialRequest.status, None),
+        (FREE_TRIALS, "employees", FreeTrialRequest, FreeTrialRequest.employees, None),
+        (FREE_TRIALS, "day", FreeTrialRequest, _utc_date(FreeTrialRequest.created_at), None),
+    ]
+
+    # Writers block on their counter upsert until the rebuild commits, so nothing is double counted
+    await db.execute(text("LOCK TABLE lead_counters IN EXCLUSIVE MODE"))
+    await db.execute(delete(LeadCounter))
+
+    for module, dimension, model, column, condition in sources:
+        query = select(column, func.count(model.id)).where(column.isnot(None)).group_by(column)
+        if condition is not None:
+            query = query.where(condition)
+
+        rows = [
+            {"module": module, "dimension": dimension, "bucket": _bucket(value), "count": count}
+            for value, count in (await db.execute(query)).all()
+        ]
+        if rows:
+            await db.execute(insert(LeadCounter).values(rows))
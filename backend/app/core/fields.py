@@ -0,0 +1,86 @@
+"""
+Field selection and fast JSON serialization for list endpoints
+
+?fields=id,full_name,status limits a list to some fields of its response
+schema: only those columns are selected (Core columns or load_only) and the
+page is serialized with a trimmed variant of the schema.
+
+list_response() serializes a page straight to JSON bytes with a TypeAdapter
+(built once per schema / field set and cached), so the endpoint returns a
+ready Response and FastAPI's response_model validation + jsonable_encoder
+pass is skipped.
+"""
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Type
+from fastapi import Response
+from pydantic import BaseModel, Field, TypeAdapter, create_model
+from sqlalchemy.orm import load_only
+
+def parse_fields(fields: Optional[str], schema: Type[BaseModel]) -> Optional[Tuple[str, ...]]:
+    """
+    Requested field names (validated against schema), or None for all fields
+    Raises ValueError for unknown fields.
+    """
+    if not fields:
+        return None
+
+    requested = tuple(dict.fromkeys(name.strip() for name in fields.split(",") if name.strip()))
+    unknown = [name for name in requested if name not in schema.model_fields]
+    if unknown:
+        raise ValueError(
+            f"Unknown fields: {', '.join(unknown)}. Available: {', '.join(schema.model_fields)}"
+        )
+    return requested or None
+
+def _column_names(model, names: Iterable[str]) -> List[str]:
+    # Keyset pagination always needs id and created_at
+    columns = model.__table__.c
+    return [name for name in dict.fromkeys([*names, "id", "created_at"]) if name in columns]
+
+def load_only_fields(model, fields: Iterable[str]):
+    """
+    load_only() option for the requested columns (plus what keyset pagination needs)
+    """
+    return load_only(*[getattr(model, name) for name in _column_names(model, fields)])
+
+def schema_columns(model, schema: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None) -> list:
+    """
+    Table columns behind schema (or just fields of it), for a Core select()
+    """
+    return [model.__table__.c[name] for name in _column_names(model, fields or schema.model_fields)]
+
+@lru_cache(maxsize=256)
+def list_adapter(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]] = None) -> TypeAdapter:
+    """
+    TypeAdapter for a list of schema, optionally trimmed to fields
+    Trimmed-out fields become optional and are left out of the output; the schema's validators still apply.
+    """
+    if fields is None:
+        return TypeAdapter(List[schema])
+
+    trimmed = create_model(
+        f"{schema.__name__}Fields",
+        __base__=schema,
+        **{
+            name: (Optional[Any], Field(default=None, exclude=True))
+            for name in schema.model_fields
+            if name not in fields
+        }
+    )
+    return TypeAdapter(List[trimmed])
+
+def list_response(schema: Type[BaseModel], fields: Optional[Tuple[str, ...]], rows: Iterable[Any], headers: Optional[Dict[str, str]] = None) -> Response:
+    """
+    JSON response for a page of Core rows or ORM objects
+    """
+    names = fields or tuple(schema.model_fields)
+    items = [
+        dict(row._mapping) if hasattr(row, "_mapping") else {name: getattr(row, name) for name in names}
+        for row in rows
+    ]
+    adapter = list_adapter(schema, fields)
+    return Response(
+        content=adapter.dump_json(adapter.validate_python(items)),
+        media_type="application/json",
+        headers=headers
+    )
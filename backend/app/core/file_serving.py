@@ -0,0 +1,165 @@
+"""
+Download of stored uploads (resumes, project attachments)
+
+Responses carry a strong ETag (the file's SHA-256, so it is identical across
+workers and deploys), a content type guessed from the extension, and
+Cache-Control. Single byte ranges are answered with 206 Partial Content
+(resumable downloads, PDF viewers fetching pages); If-None-Match gives 304.
+
+With FILE_OFFLOAD set, the response is only headers plus X-Accel-Redirect
+(nginx) or X-Sendfile (Apache / lighttpd): the front proxy streams the bytes
+itself and also handles Range, so no worker is tied up by a large download.
+"""
+import mimetypes
+import os
+from typing import AsyncIterator, Optional, Tuple
+from urllib.parse import quote
+import aiofiles
+import aiofiles.os
+from fastapi import HTTPException, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.storage import resolve_upload_path
+from app.models.stored_file import StoredFile
+
+# Stored files never change under their path (content-addressed), so clients can keep them
+FILE_CACHE_CONTROL = "private, max-age=31536000, immutable"
+
+def content_type(filename: str) -> str:
+    media_type, _ = mimetypes.guess_type(filename)
+    return media_type or "application/octet-stream"
+
+def content_disposition(filename: str, inline: bool = False) -> str:
+    """
+    Content-Disposition with an ASCII fallback and the UTF-8 name (RFC 6266)
+    """
+    disposition = "inline" if inline else "attachment"
+    fallback = filename.encode("ascii", "ignore").decode().replace('"', "").replace("\\", "") or "download"
+    if fallback == filename:
+        return f'{disposition}; filename="{filename}"'
+    return f"{disposition}; filename=\"{fallback}\"; filename*=UTF-8''{quote(filename)}"
+
+def parse_range(header: Optional[str], size: int) -> Optional[Tuple[int, int]]:
+    """
+    (start, end) inclusive of a single "bytes=" range, None to send the whole file
+    Raises ValueError if the range cannot be satisfied.
+    """
+    if not header or not header.startswith("bytes="):
+        return None
+
+    ranges = header[len("bytes="):].split(",")
+    if len(ranges) != 1:
+        # Multipart/byteranges is not worth it for documents: send the whole file
+        return None
+
+    first, _, last = ranges[0].strip().partition("-")
+    try:
+        if first:
+            start = int(first)
+            end = int(last) if last else size - 1
+        else:
+            # Suffix range: the last N bytes
+            start = size - int(last)
+            end = size - 1
+    except ValueError:
+        return None
+
+    start = max(start, 0)
+    end = min(end, size - 1)
+    if start > end or start >= size:
+        raise ValueError(f"Range not satisfiable for {size} bytes")
+    return start, end
+
+async def file_etag(db: AsyncSession, relative_path: str, sha256: Optional[str] = None) -> str:
+    """
+    Strong ETag of a stored file: its SHA-256 (from metadata, stored_files, or the path itself)
+    """
+    if not sha256:
+        sha256 = await db.scalar(select(StoredFile.sha256).where(StoredFile.path == relative_path))
+    if not sha256:
+        # Content-addressed name: <sha256><ext>
+        sha256 = os.path.splitext(os.path.basename(relative_path))[0]
+    return f'"{sha256}"'
+
+async def read_file_range(path, start: int, length: int) -> AsyncIterator[bytes]:
+    """
+    length bytes of a file from start, in UPLOAD_CHUNK_SIZE chunks
+    """
+    async with aiofiles.open(path, "rb") as f:
+        await f.seek(start)
+        while length > 0:
+            chunk = await f.read(min(settings.UPLOAD_CHUNK_SIZE, length))
+            if not chunk:
+                break
+            length -= len(chunk)
+            yield chunk
+
+def _etag_matches(header: Optional[str], etag: str) -> bool:
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return "*" in tags or etag in tags
+
+async def serve_upload(
+    request: Request,
+    db: AsyncSession,
+    relative_path: str,
+    filename: str,
+    sha256: Optional[str] = None
+) -> Response:
+    """
+    Response for a stored file: 200 / 206 / 304 / 416, or an offload header for the front proxy
+    Raises HTTPException 404 if the file is missing on disk.
+    """
+    path = resolve_upload_path(relative_path)
+    try:
+        stat = await aiofiles.os.stat(path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="File not found")
+
+    etag = await file_etag(db, relative_path, sha256)
+    headers = {
+        "ETag": etag,
+        "Cache-Control": FILE_CACHE_CONTROL,
+        "Content-Disposition": content_disposition(filename),
+        "Accept-Ranges": "bytes",
+    }
+    media_type = content_type(filename)
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+
+    if settings.FILE_OFFLOAD == "x-accel-redirect":
+        # nginx serves <prefix><relative_path> from an internal location (Range included)
+        headers["X-Accel-Redirect"] = settings.FILE_OFFLOAD_PREFIX.rstrip("/") + "/" + quote(relative_path)
+        return Response(headers=headers, media_type=media_type)
+    if settings.FILE_OFFLOAD == "x-sendfile":
+        headers["X-Sendfile"] = str(path.resolve())
+        return Response(headers=headers, media_type=media_type)
+
+    size = stat.st_size
+    byte_range = None
+    # If-Range: only honour the range if the client's copy is still this file
+    if_range = request.headers.get("if-range")
+    if not if_range or if_range.strip() == etag:
+        try:
+            byte_range = parse_range(request.headers.get("range"), size)
+        except ValueError:
+            headers["Content-Range"] = f"bytes */{size}"
+            return Response(status_code=416, headers=headers)
+
+    if byte_range is None:
+        headers["Content-Length"] = str(size)
+        return StreamingResponse(read_file_range(path, 0, size), media_type=media_type, headers=headers)
+
+    start, end = byte_range
+    headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+    headers["Content-Length"] = str(end - start + 1)
+    return StreamingResponse(
+        read_file_range(path, start, end - start + 1),
+        status_code=206,
+        media_type=media_type,
+        headers=headers
+    )
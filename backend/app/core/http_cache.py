@@ -0,0 +1,99 @@
+"""
+Conditional GET (ETag / Last-Modified / 304 Not Modified)
+
+A single row's validators are id + coalesce(updated_at, created_at). They are
+taken from the loaded row on a plain GET; only when the request carries
+If-None-Match / If-Modified-Since is a small probe query run first, so a
+still-current copy gets 304 without loading or serializing the row.
+
+A list page's ETag is a hash of the serialized page itself, so it costs no
+query beyond the (keyset-paginated) page query, and a 304 only saves the
+transfer. Lists have no Last-Modified: a delete changes the page but not the
+newest timestamp on it, so only the ETag can tell.
+"""
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Dict, Optional, Tuple
+from fastapi import Request, Response
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+def make_etag(*parts) -> str:
+    """
+    Weak ETag for the given version parts
+    """
+    digest = hashlib.sha1("|".join(str(part) for part in parts).encode()).hexdigest()[:32]
+    return f'W/"{digest}"'
+
+def cache_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    """
+    Validator headers; clients may keep the response but must revalidate it
+    """
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified.astimezone(timezone.utc), usegmt=True)
+    return headers
+
+def is_conditional(request: Request) -> bool:
+    """
+    True if the request can be answered with 304 (worth probing before loading the row)
+    """
+    return "if-none-match" in request.headers or "if-modified-since" in request.headers
+
+def row_validators(row) -> Tuple[str, datetime]:
+    """
+    (ETag, Last-Modified) of a loaded row, the same values probe_row() returns
+    """
+    last_modified = row.updated_at or row.created_at
+    return make_etag(row.__tablename__, row.id, last_modified), last_modified
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime] = None) -> bool:
+    """
+    True if the client's cached copy is still current (If-None-Match wins over If-Modified-Since)
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match:
+        # Weak comparison: W/"x" and "x" match
+        tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        return "*" in tags or etag.removeprefix("W/") in tags
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        if since.tzinfo is None:
+            since = since.replace(tzinfo=timezone.utc)
+        # HTTP dates have second precision
+        return last_modified.astimezone(timezone.utc).replace(microsecond=0) <= since
+    return False
+
+def not_modified_response(headers: Dict[str, str]) -> Response:
+    return Response(status_code=304, headers=headers)
+
+async def probe_row(db: AsyncSession, model, *conditions) -> Optional[Tuple[str, datetime]]:
+    """
+    (ETag, Last-Modified) of the row of model matching conditions, None if there is none
+    """
+    row = (await db.execute(
+        select(model.id, func.coalesce(model.updated_at, model.created_at)).where(*conditions)
+    )).first()
+    if row is None:
+        return None
+
+    row_id, last_modified = row
+    return make_etag(model.__tablename__, row_id, last_modified), last_modified
+
+def conditional_page(request: Request, response: Response) -> Response:
+    """
+    Add the ETag of a serialized list page to response, or 304 if the client already has it
+    """
+    etag = make_etag(hashlib.sha1(response.body).hexdigest())
+    headers = cache_headers(etag, None)
+    if is_not_modified(request, etag):
+        return not_modified_response(headers)
+
+    response.headers.update(headers)
+    return response
@@ -0,0 +1,57 @@
+"""
+Single-round-trip inserts for the create endpoints
+
+insert_returning() sends INSERT ... RETURNING, so generated columns (id,
+created_at, ...) come back with the insert itself instead of a SELECT after
+the commit (db.refresh). With a guard the insert becomes
+INSERT ... SELECT ... WHERE <guard> RETURNING ..., which lets the database
+enforce a limit in the same statement: no row comes back when the guard fails.
+"""
+from datetime import timedelta
+from typing import Any, Dict, Optional
+from sqlalchemy import Enum, String, select, insert, func, literal, cast
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.rate_limit import parse_rate
+
+def _select_type(column_type):
+    """
+    Type to cast a SELECTed insert value to
+    An explicit CAST(... AS VARCHAR(n)) silently truncates, so sized strings are
+    cast unsized and the INSERT's assignment still rejects over-long values.
+    """
+    if isinstance(column_type, String) and not isinstance(column_type, Enum) and column_type.length:
+        return String()
+    return column_type
+
+async def insert_returning(db: AsyncSession, model, values: Dict[str, Any], guard=None) -> Optional[Dict[str, Any]]:
+    """
+    Insert one row of model and return all of its columns as a dict
+    (None when guard is given and evaluates to false)
+    """
+    table = model.__table__
+
+    if guard is None:
+        stmt = insert(table).values(**values)
+    else:
+        row = select(*[
+            cast(literal(value, table.c[name].type), _select_type(table.c[name].type))
+            for name, value in values.items()
+        ]).where(guard)
+        stmt = insert(table).from_select(list(values), row)
+
+    # Generated columns (search vectors) are not needed by the caller
+    result = await db.execute(stmt.returning(*[column for column in table.c if column.computed is None]))
+    inserted = result.mappings().first()
+    return dict(inserted) if inserted is not None else None
+
+def under_rate(model, rate: str, **filters):
+    """
+    Guard: fewer rows of model matching filters were created within the window of rate
+    (a database-side backstop for the rate limiter, e.g. across workers)
+    """
+    limit, window = parse_rate(rate)
+    recent = select(func.count()).select_from(model.__table__).where(
+        *[getattr(model, column) == value for column, value in filters.items()],
+        model.created_at >= func.now() - timedelta(seconds=window)
+    )
+    return recent.scalar_subquery() < limit
@@ -0,0 +1,78 @@
+"""
+Keyset (cursor) pagination helpers for list endpoints
+
+Lists are ordered by (created_at DESC, id DESC). The cursor is an opaque,
+URL-safe token holding the (created_at, id) of the last row of a page, and the
+next page is fetched with a row-value comparison that the matching composite
+(created_at, id) index can answer directly - no OFFSET scan.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, List, Optional, Tuple
+from sqlalchemy import tuple_
+from app.core.config import settings
+
+def clamp_page_size(limit: int) -> int:
+    """
+    Keep page size between 1 and settings.MAX_PAGE_SIZE
+    """
+    return max(1, min(limit, settings.MAX_PAGE_SIZE))
+
+def encode_token(values: List[Any]) -> str:
+    """
+    Opaque, URL-safe token for a list of JSON values
+    """
+    raw = json.dumps(values).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+def decode_token(token: str) -> List[Any]:
+    """
+    Values of a token, raises ValueError if it is malformed
+    """
+    try:
+        values = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except Exception:
+        raise ValueError("Invalid cursor")
+    if not isinstance(values, list):
+        raise ValueError("Invalid cursor")
+    return values
+
+def encode_cursor(created_at: datetime, row_id: int) -> str:
+    """
+    Opaque cursor for the row a page ended on
+    """
+    return encode_token([created_at.isoformat(), row_id])
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Decode a cursor, raises ValueError if it is malformed
+    """
+    try:
+        created_at, row_id = decode_token(cursor)
+        return datetime.fromisoformat(created_at), int(row_id)
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def paginate(query, model, limit: int, skip: int = 0, cursor: Optional[str] = None):
+    """
+    Apply (created_at, id) ordering plus cursor or skip/limit to a select()
+    """
+    query = query.order_by(model.created_at.desc(), model.id.desc())
+
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        query = query.where(tuple_(model.created_at, model.id) < (created_at, row_id))
+    elif skip:
+        query = query.offset(skip)
+
+    return query.limit(limit)
+
+def next_cursor(rows, limit: int) -> Optional[str]:
+    """
+    Cursor for the following page, or None when this page is the last one
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(last.created_at, last.id)
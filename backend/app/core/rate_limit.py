@@ -0,0 +1,175 @@
+"""
+Rate limiting for the public submission endpoints
+
+Limits are written as "<count>/<period>" (e.g. "5/day", "20/hour") and use a
+sliding-window counter: each key keeps the counts of the current and previous
+fixed window, and the previous one is weighted by how much of it still
+overlaps the sliding window. That is O(1) memory per key; the in-process
+backend also caps the number of keys (least recently used keys are dropped).
+With RATE_LIMIT_BACKEND=redis the counters are shared by all workers.
+
+Two layers use it:
+- RateLimitMiddleware rejects floods per client IP before the request body is
+  read (settings.RATE_LIMITS_PER_IP, keyed by path)
+- the handlers check per-identity limits (email, email+IP, ...) with
+  rate_limiter.check() and count successful submissions with record()
+"""
+import json
+import logging
+import math
+import time
+from collections import OrderedDict
+from typing import Tuple
+from app.core.config import settings
+
+try:
+    import redis.asyncio as redis_asyncio
+except ImportError:  # optional dependency, only needed for RATE_LIMIT_BACKEND=redis
+    redis_asyncio = None
+
+logger = logging.getLogger(__name__)
+
+PERIODS = {
+    "second": 1,
+    "minute": 60,
+    "hour": 3600,
+    "day": 86400,
+}
+
+def parse_rate(rate: str) -> Tuple[int, int]:
+    """
+    "5/day" -> (5, 86400)
+    """
+    count, _, period = rate.partition("/")
+    return int(count), PERIODS[period.strip().lower().rstrip("s")]
+
+class MemoryRateLimitBackend:
+    """
+    In-process sliding-window counters, bounded to max_keys
+    """
+    name = "memory"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        # key -> [window index, current window count, previous window count]
+        self._windows: "OrderedDict[str, list]" = OrderedDict()
+
+    def _window(self, key: str, window: int, now: float) -> list:
+        index = int(now // window)
+        state = self._windows.get(key)
+        if state is None:
+            state = [index, 0, 0]
+            self._windows[key] = state
+        elif state[0] != index:
+            # Roll forward: the old current window becomes previous (or both expire)
+            state[2] = state[1] if state[0] == index - 1 else 0
+            state[1] = 0
+            state[0] = index
+
+        self._windows.move_to_end(key)
+        while len(self._windows) > self.max_keys:
+            self._windows.popitem(last=False)
+        return state
+
+    async def count(self, key: str, window: int) -> float:
+        now = time.time()
+        _, current, previous = self._window(key, window, now)
+        elapsed = (now % window) / window
+        return previous * (1 - elapsed) + current
+
+    async def incr(self, key: str, window: int):
+        self._window(key, window, time.time())[1] += 1
+
+class RedisRateLimitBackend:
+    """
+    Shared sliding-window counters (one Redis key per fixed window)
+    """
+    name = "redis"
+
+    def __init__(self, url: str):
+        self._redis = redis_asyncio.from_url(url)
+
+    async def count(self, key: str, window: int) -> float:
+        now = time.time()
+        index = int(now // window)
+        current, previous = await self._redis.mget(f"rl:{key}:{index}", f"rl:{key}:{index - 1}")
+        elapsed = (now % window) / window
+        return int(previous or 0) * (1 - elapsed) + int(current or 0)
+
+    async def incr(self, key: str, window: int):
+        redis_key = f"rl:{key}:{int(time.time() // window)}"
+        async with self._redis.pipeline(transaction=True) as pipe:
+            await pipe.incr(redis_key).expire(redis_key, window * 2).execute()
+
+class RateLimiter:
+    """
+    Per-endpoint limits on top of a counter backend
+    """
+    def __init__(self, backend):
+        self.backend = backend
+
+    async def check(self, scope: str, identity: str, rate: str) -> bool:
+        """
+        True if identity may still submit to scope under rate (does not count)
+        """
+        limit, window = parse_rate(rate)
+        return await self.backend.count(f"{scope}:{identity}", window) < limit
+
+    async def record(self, scope: str, identity: str, rate: str):
+        """
+        Count one submission of identity to scope
+        """
+        _, window = parse_rate(rate)
+        await self.backend.incr(f"{scope}:{identity}", window)
+
+    async def hit(self, scope: str, identity: str, rate: str) -> bool:
+        """
+        check() + record() - counts every attempt, used for flood control
+        """
+        if not await self.check(scope, identity, rate):
+            return False
+        await self.record(scope, identity, rate)
+        return True
+
+def build_backend():
+    """
+    Backend selected by settings.RATE_LIMIT_BACKEND (falls back to memory)
+    """
+    if settings.RATE_LIMIT_BACKEND == "redis":
+        if redis_asyncio is not None and settings.REDIS_URL:
+            return RedisRateLimitBackend(settings.REDIS_URL)
+        logger.warning("RATE_LIMIT_BACKEND=redis but redis is not installed or REDIS_URL is not set, using memory")
+    return MemoryRateLimitBackend(settings.RATE_LIMIT_MAX_KEYS)
+
+rate_limiter = RateLimiter(build_backend())
+
+class RateLimitMiddleware:
+    """
+    ASGI middleware: per-IP limits for POST endpoints, applied before the body is read
+    """
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["method"] == "POST":
+            rate = settings.RATE_LIMITS_PER_IP.get(scope["path"])
+            client_ip = scope["client"][0] if scope.get("client") else "unknown"
+
+            if rate and not await rate_limiter.hit(f"ip:{scope['path']}", client_ip, rate):
+                _, window = parse_rate(rate)
+                body = json.dumps({"detail": "Too many requests. Please try again later."}).encode()
+                await send({
+                    "type": "http.response.start",
+                    "status": 429,
+                    "headers": [
+                        (b"content-type", b"application/json"),
+                        (b"content-length", str(len(body)).encode()),
+                        (b"retry-after", str(math.ceil(window - time.time() % window)).encode()),
+                        # Tell the client not to keep sending the (unread) body
+                        (b"connection", b"close"),
+                    ],
+                })
+                await send({"type": "http.response.body", "body": body})
+                return
+
+        await self.app(scope, receive, send)
@@ -0,0 +1,128 @@
+"""
+Upload type detection from the first bytes of the stream
+
+The first chunk of an upload is identified with libmagic (python-magic, run in
+a worker thread) and must match the file's extension, which must be one of the
+extensions allowed in settings for that kind of upload; disallowed, empty or
+mismatched files are rejected before anything is written to the store. Without
+libmagic, a built-in table of leading-byte signatures covers the known types;
+it is also used when libmagic only gives a generic answer, which it can for
+the truncated head of an Office document.
+"""
+import asyncio
+import logging
+from typing import Iterable, Optional
+from app.core.config import settings
+
+try:
+    import magic
+except ImportError:  # python-magic or the libmagic system library is missing
+    magic = None
+
+logger = logging.getLogger(__name__)
+
+if magic is None:
+    logger.warning("libmagic is not available, upload types are checked against built-in signatures only")
+
+# OLE2 compound documents (legacy Office formats)
+_OLE_TYPES = {"application/msword", "application/vnd.ms-excel", "application/x-ole-storage", "application/CDFV2", "application/vnd.ms-office"}
+# OOXML documents are zip archives; libmagic reports either depending on version and member order
+_OOXML_TYPES = {"application/zip"}
+
+# Extension -> MIME types its content may be detected as (which extensions are
+# accepted is configured in settings; each of them needs an entry here)
+KNOWN_CONTENT_TYPES = {
+    ".pdf": {"application/pdf"},
+    ".doc": _OLE_TYPES,
+    ".xls": _OLE_TYPES,
+    ".docx": _OOXML_TYPES | {"application/vnd.openxmlformats-officedocument.wordprocessingml.document"},
+    ".xlsx": _OOXML_TYPES | {"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"},
+    ".jpg": {"image/jpeg"},
+    ".jpeg": {"image/jpeg"},
+    ".png": {"image/png"},
+    ".gif": {"image/gif"},
+    ".webp": {"image/webp"},
+    ".txt": {"text/plain", "text/csv"},
+}
+
+# What libmagic reports when the sniffed head is not enough to identify the file
+_GENERIC_TYPES = {"application/octet-stream", "application/CDFV2-corrupt"}
+
+# Leading bytes -> MIME type (fallback without libmagic)
+SIGNATURES = [
+    (b"%PDF-", "application/pdf"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1", "application/x-ole-storage"),
+    (b"PK\x03\x04", "application/zip"),
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"GIF87a", "image/gif"),
+    (b"GIF89a", "image/gif"),
+]
+
+class UploadTypeError(Exception):
+    """
+    Raised when an upload's content is not an allowed type or does not match its extension
+    """
+    def __init__(self, extension: str, detected: Optional[str]):
+        self.extension = extension
+        self.detected = detected
+        super().__init__(f"File content ({detected or 'unknown'}) does not match its type ({extension or 'none'})")
+
+def _signature_type(head: bytes) -> Optional[str]:
+    for signature, media_type in SIGNATURES:
+        if head.startswith(signature):
+            return media_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    if b"\x00" not in head:
+        try:
+            head.decode("utf-8")
+            return "text/plain"
+        except UnicodeDecodeError as error:
+            # A multi-byte character cut off at the end of the sniffed window is fine
+            if error.reason == "unexpected end of data":
+                return "text/plain"
+    return None
+
+async def detect_content_type(head: bytes) -> Optional[str]:
+    """
+    MIME type of a file from its first bytes (libmagic in a worker thread, else signatures)
+    """
+    if magic is None:
+        return _signature_type(head)
+    detected = await asyncio.to_thread(magic.from_buffer, head, mime=True)
+    if detected in _GENERIC_TYPES:
+        return _signature_type(head) or detected
+    return detected
+
+def check_upload_settings():
+    """
+    Fail at startup if settings allow an extension whose content cannot be checked
+    """
+    configured = {
+        "ALLOWED_FILE_TYPES_STR": settings.ALLOWED_FILE_TYPES,
+        "ALLOWED_PROJECT_FILE_TYPES_STR": settings.ALLOWED_PROJECT_FILE_TYPES,
+        "ALLOWED_IMAGE_TYPES_STR": settings.ALLOWED_IMAGE_TYPES,
+    }
+    for name, extensions in configured.items():
+        unknown = [extension for extension in extensions if extension.lower() not in KNOWN_CONTENT_TYPES]
+        if unknown:
+            raise RuntimeError(
+                f"{name} allows {', '.join(unknown)}, which has no known content signature "
+                f"(add it to KNOWN_CONTENT_TYPES in app/core/sniffing.py). Known: {', '.join(KNOWN_CONTENT_TYPES)}"
+            )
+
+async def check_upload_type(head: bytes, extension: str, allowed_extensions: Iterable[str]):
+    """
+    Make sure the first bytes of an upload are an allowed, non-empty type matching extension
+    Raises UploadTypeError otherwise.
+    """
+    extension = extension.lower()
+    if extension not in {allowed.lower() for allowed in allowed_extensions}:
+        raise UploadTypeError(extension, None)
+    if not head:
+        raise UploadTypeError(extension, "empty file")
+
+    detected = await detect_content_type(head[:settings.UPLOAD_SNIFF_BYTES])
+    if detected not in KNOWN_CONTENT_TYPES.get(extension, ()):
+        raise UploadTypeError(extension, detected)
@@ -0,0 +1,179 @@
+"""
+Upload storage - all file system work runs off the event loop (aiofiles)
+
+Files are content-addressed: they are stored as <subdirectory>/ab/cd/<sha256><ext>
+(two levels of fan-out taken from the hash, so no directory grows too large),
+and identical uploads are written once and shared. The stored_files table keeps
+a reference count per stored path.
+"""
+import hashlib
+import uuid
+from pathlib import Path
+import aiofiles
+import aiofiles.os
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.config import settings
+from app.core.sniffing import check_upload_type
+from app.models.stored_file import StoredFile
+
+# Subdirectories of UPLOAD_DIR, created once at startup
+UPLOAD_SUBDIRECTORIES = ("resumes", "project_docs", "images", "tmp")
+
+# Shard directories already created by this process
+_created_shards = set()
+
+class UploadTooLargeError(Exception):
+    """
+    Raised when a streamed upload exceeds its size limit
+    """
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        super().__init__(f"Upload exceeds maximum size of {max_size} bytes")
+
+async def create_upload_directories():
+    """
+    Create upload directories (called once from the app lifespan)
+    """
+    await aiofiles.os.makedirs(settings.UPLOAD_DIR, exist_ok=True)
+    for subdirectory in UPLOAD_SUBDIRECTORIES:
+        await aiofiles.os.makedirs(settings.UPLOAD_DIR / subdirectory, exist_ok=True)
+
+def sharded_path(subdirectory: str, digest: str, extension: str) -> str:
+    """
+    Relative path of a content-addressed file: <subdirectory>/ab/cd/<digest><ext>
+    """
+    return f"{subdirectory}/{digest[:2]}/{digest[2:4]}/{digest}{extension.lower()}"
+
+async def ensure_shard_directory(relative_path: str):
+    """
+    Create the shard directory of a stored file (once per process)
+    """
+    shard = str(Path(relative_path).parent)
+    if shard not in _created_shards:
+        await aiofiles.os.makedirs(settings.UPLOAD_DIR / shard, exist_ok=True)
+        _created_shards.add(shard)
+
+def resolve_upload_path(relative_path: str) -> Path:
+    """
+    Absolute path of a stored file from its relative path ("resumes/<name>")
+    """
+    return settings.UPLOAD_DIR / relative_path
+
+async def upload_exists(relative_path: str) -> bool:
+    """
+    Check that a stored file exists without blocking the event loop
+    """
+    return await aiofiles.os.path.isfile(resolve_upload_path(relative_path))
+
+async def save_upload_stream(upload, subdirectory: str, extension: str, max_size: int, allowed_extensions) -> dict:
+    """
+    Copy an UploadFile into the content-addressed store in fixed-size chunks.
+    Size and SHA-256 are computed on the fly, so the copy holds one chunk in memory.
+    If the same bytes are already stored, the new copy is discarded.
+    Raises UploadTypeError if extension is not in allowed_extensions or the first chunk
+    is empty or does not match it
+    (nothing is written then), and UploadTooLargeError (removing the partial file)
+    once the copy passes max_size.
+
+    By then Starlette has already received the whole request body and spooled this
+    file to a temporary file, so it is written to disk twice and max_size does not
+    stop the upload early; RequestBodyLimitMiddleware caps the body before parsing.
+    """
+    # Detect the real type before touching the disk
+    chunk = await upload.read(settings.UPLOAD_CHUNK_SIZE)
+    await check_upload_type(chunk, extension, allowed_extensions)
+
+    temp_path = settings.UPLOAD_DIR / "tmp" / f"{uuid.uuid4()}.part"
+
+    size = 0
+    sha256 = hashlib.sha256()
+
+    try:
+        async with aiofiles.open(temp_path, 'wb') as f:
+            while chunk:
+                size += len(chunk)
+                if size > max_size:
+                    raise UploadTooLargeError(max_size)
+
+                sha256.update(chunk)
+                await f.write(chunk)
+                chunk = await upload.read(settings.UPLOAD_CHUNK_SIZE)
+
+        digest = sha256.hexdigest()
+        relative_path = sharded_path(subdirectory, digest, extension)
+        file_path = resolve_upload_path(relative_path)
+
+        deduplicated = await aiofiles.os.path.exists(file_path)
+        if deduplicated:
+            await aiofiles.os.remove(temp_path)
+        else:
+            # Only expose the file under its final name once it is complete
+            await ensure_shard_directory(relative_path)
+            await aiofiles.os.replace(temp_path, file_path)
+    except BaseException:
+        if await aiofiles.os.path.exists(temp_path):
+            await aiofiles.os.remove(temp_path)
+        raise
+
+    return {
+        "path": relative_path,
+        "size": size,
+        "sha256": digest,
+        "deduplicated": deduplicated
+    }
+
+class UploadLostError(Exception):
+    """
+    Raised when a deduplicated file was removed by a concurrent cleanup before it could be referenced
+    """
+
+async def _lock_path(db: AsyncSession, relative_path: str):
+    # Serializes referencing and discarding of one stored path until the transaction ends
+    await db.execute(select(func.pg_advisory_xact_lock(func.hashtext(relative_path))))
+
+async def add_file_reference(db: AsyncSession, saved_file: dict):
+    """
+    Count one more reference to a stored file (part of the caller's transaction)
+    Raises UploadLostError if the file is gone (discarded by a concurrent request).
+    """
+    await _lock_path(db, saved_file["path"])
+    stmt = insert(StoredFile).values(
+        path=saved_file["path"],
+        sha256=saved_file["sha256"],
+        size=saved_file["size"],
+        ref_count=1
+    )
+    await db.execute(
+        stmt.on_conflict_do_update(
+            index_elements=[StoredFile.path],
+            set_={"ref_count": StoredFile.ref_count + 1}
+        )
+    )
+    if not await upload_exists(saved_file["path"]):
+        raise UploadLostError(f"Stored file disappeared: {saved_file['path']}")
+
+async def discard_uploads(db: AsyncSession, relative_paths):
+    """
+    Delete files saved by a request that failed, unless a stored_files row references them
+    (a concurrent upload of the same bytes). Decided under the path lock; commits db.
+    """
+    try:
+        for relative_path in dict.fromkeys(relative_paths):
+            await _lock_path(db, relative_path)
+            referenced = await db.scalar(select(StoredFile.path).where(StoredFile.path == relative_path))
+            if referenced is None:
+                await delete_upload(relative_path)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        print(f"⚠️ Could not clean up uploads: {e}")
+
+async def delete_upload(relative_path: str):
+    """
+    Remove a stored file that is no longer referenced
+    """
+    file_path = resolve_upload_path(relative_path)
+    if await aiofiles.os.path.exists(file_path):
+        await aiofiles.os.remove(file_path)
@@ -6,44 +6,9 @@ import uuid
 import re
 from datetime import datetime
 from typing import List
-import aiofiles
 from pathlib import Path
 from app.core.config import settings
 
-def save_uploaded_file(file_content: bytes, subdirectory: str, filename: str) -> str:
-    """
-    Save uploaded file to disk
-    """
-    # Create directory if it doesn't exist
-    save_dir = settings.UPLOAD_DIR / subdirectory
-    save_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save file
-    file_path = save_dir / filename
-    
-    with open(file_path, 'wb') as f:
-        f.write(file_content)
-    
-    # Return relative path
-    return f"{subdirectory}/{filename}"
-
-async def save_uploaded_file_async(file_content: bytes, subdirectory: str, filename: str) -> str:
-    """
-    Save uploaded file asynchronously
-    """
-    # Create directory if it doesn't exist
-    save_dir = settings.UPLOAD_DIR / subdirectory
-    save_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Save file
-    file_path = save_dir / filename
-    
-    async with aiofiles.open(file_path, 'wb') as f:
-        await f.write(file_content)
-    
-    # Return relative path
-    return f"{subdirectory}/{filename}"
-
 def validate_file_by_extension(filename: str, allowed_extensions: List[str]) -> bool:
     """
     Validate file by extension
@@ -57,12 +22,6 @@ def validate_file_by_extension(filename: str, allowed_extensions: List[str]) ->
     # Check if extension is in allowed list
     return extension in allowed_extensions
 
-def validate_file_size(file_content: bytes, max_size: int) -> bool:
-    """
-    Validate file size
-    """
-    return len(file_content) <= max_size
-
 def generate_application_id() -> str:
     """
     Generate unique application ID
@@ -136,22 +95,6 @@ def is_valid_phone(phone: str) -> bool:
     pattern = r'^[\d\s\+\-\(\)]{10,20}$'
     return bool(re.match(pattern, phone))
 
-def create_directories():
-    """
-    Create necessary directories
-    """
-    # Main upload directory
-    settings.UPLOAD_DIR.mkdir(parents=True, exist_ok=True)
-    
-    # Subdirectories
-    (settings.UPLOAD_DIR / "resumes").mkdir(parents=True, exist_ok=True)
-    (settings.UPLOAD_DIR / "images").mkdir(parents=True, exist_ok=True)
-    
-    print(f"📁 Directories created at: {settings.UPLOAD_DIR.absolute()}")
-
-# Create directories on import
-create_directories()
-
 def generate_project_id() -> str:
     """
     Generate unique application ID
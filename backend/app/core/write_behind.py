@@ -0,0 +1,191 @@
+"""
+Write-behind queue for high-volume lead submissions (opt-in: WRITE_BEHIND_ENABLED)
+
+/contact, /trial and /inquiries/submit validate the lead, give it a
+submission_id and put it on a bounded in-process queue, then answer
+202 Accepted. A background task flushes the queue with one multi-row INSERT
+per table every WRITE_BEHIND_FLUSH_INTERVAL_MS or WRITE_BEHIND_BATCH_SIZE rows,
+whichever comes first, so a traffic spike costs one commit per batch instead
+of one per lead.
+
+- inserts use ON CONFLICT (submission_id) DO NOTHING, so a retried batch is safe
+- when the queue is full, enqueue() waits WRITE_BEHIND_ENQUEUE_TIMEOUT_MS and
+  then raises QueueFullError (the API answers 503 + Retry-After)
+- stop() stops accepting, drains the queue and is called on shutdown
+- a batch that still fails after retries is inserted row by row; only the
+  leads that fail on their own are appended to WRITE_BEHIND_DEAD_LETTER_PATH
+  as NDJSON instead of being lost silently
+"""
+import asyncio
+import json
+import logging
+from collections import defaultdict
+from typing import Dict, List, Tuple
+import aiofiles
+from sqlalchemy.dialects.postgresql import insert
+from app.core.config import settings
+from app.core import counters
+from app.core.cache import invalidate_module
+from app.database import AsyncSessionLocal
+from app.models.contact import ContactInquiry
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+
+logger = logging.getLogger(__name__)
+
+# Module name -> model of the leads that may be queued
+QUEUED_MODELS = {
+    counters.CONTACT_INQUIRIES: ContactInquiry,
+    counters.PRODUCT_INQUIRIES: ProductInquiry,
+    counters.FREE_TRIALS: FreeTrialRequest,
+}
+
+FLUSH_RETRIES = 3
+
+class QueueFullError(Exception):
+    """
+    Raised when the write-behind queue stays full (backpressure)
+    """
+
+class WriteBehindQueue:
+    def __init__(self):
+        self._queue: "asyncio.Queue[Tuple[str, Dict]]" = asyncio.Queue(maxsize=settings.WRITE_BEHIND_MAX_QUEUE)
+        self._task = None
+        self._accepting = False
+
+    @property
+    def running(self) -> bool:
+        return self._accepting
+
+    async def start(self):
+        """
+        Start the background flusher (called from the app lifespan)
+        """
+        self._accepting = True
+        self._task = asyncio.create_task(self._run())
+        logger.info("Write-behind queue started")
+
+    async def stop(self):
+        """
+        Stop accepting leads and flush everything still queued
+        """
+        self._accepting = False
+        if self._task is None:
+            return
+
+        try:
+            await asyncio.wait_for(self._queue.join(), settings.WRITE_BEHIND_DRAIN_TIMEOUT_S)
+        except asyncio.TimeoutError:
+            logger.error(f"Write-behind drain timed out with {self._queue.qsize()} leads queued")
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        logger.info("Write-behind queue drained")
+
+    async def enqueue(self, module: str, values: Dict):
+        """
+        Queue the column values of a new lead, waiting briefly if the queue is full
+        """
+        if not self._accepting:
+            raise QueueFullError("Write-behind queue is not accepting submissions")
+
+        try:
+            await asyncio.wait_for(
+                self._queue.put((module, values)),
+                settings.WRITE_BEHIND_ENQUEUE_TIMEOUT_MS / 1000
+            )
+        except asyncio.TimeoutError:
+            raise QueueFullError("Write-behind queue is full")
+
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + settings.WRITE_BEHIND_FLUSH_INTERVAL_MS / 1000
+
+            while len(batch) < settings.WRITE_BEHIND_BATCH_SIZE:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+
+            try:
+                await self._flush(batch)
+            except Exception:
+                # Keep the flusher alive: later batches may still go through
+                logger.exception(f"Write-behind flush of {len(batch)} leads crashed")
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    async def _flush(self, batch: List[Tuple[str, Dict]]):
+        by_module = defaultdict(list)
+        for module, values in batch:
+            by_module[module].append(values)
+
+        for attempt in range(1, FLUSH_RETRIES + 1):
+            try:
+                await self._insert(by_module)
+                await self._invalidate(by_module)
+                logger.debug(f"Write-behind flushed {len(batch)} leads")
+                return
+            except Exception as e:
+                logger.warning(f"Write-behind flush failed (attempt {attempt}/{FLUSH_RETRIES}): {e}")
+                await asyncio.sleep(0.5 * attempt)
+
+        if len(batch) == 1:
+            await self._dead_letter(batch)
+            return
+
+        # One bad lead must not take the whole batch down: insert row by row
+        failed = []
+        for module, values in batch:
+            try:
+                await self._insert({module: [values]})
+            except Exception as e:
+                logger.warning(f"Write-behind lead {values.get('submission_id')} failed: {e}")
+                failed.append((module, values))
+
+        await self._invalidate(by_module)
+        if failed:
+            await self._dead_letter(failed)
+
+    async def _insert(self, by_module: Dict[str, List[Dict]]):
+        """
+        Insert leads and count them in one transaction
+        Only rows actually inserted are counted, so retrying a batch never counts a lead twice.
+        """
+        async with AsyncSessionLocal() as db:
+            for module, rows in by_module.items():
+                model = QUEUED_MODELS[module]
+                inserted = set((await db.execute(
+                    insert(model).values(rows).on_conflict_do_nothing(
+                        index_elements=[model.submission_id]
+                    ).returning(model.submission_id)
+                )).scalars())
+                await counters.bump_counters_bulk(
+                    db, module, [values for values in rows if values["submission_id"] in inserted]
+                )
+            await db.commit()
+
+    async def _invalidate(self, modules):
+        # Best effort: the leads are committed, a cache error must not retry the batch
+        for module in modules:
+            try:
+                await invalidate_module(module)
+            except Exception as e:
+                logger.warning(f"Cache invalidation of {module} failed: {e}")
+
+    async def _dead_letter(self, batch: List[Tuple[str, Dict]]):
+        logger.error(f"Write-behind batch of {len(batch)} leads written to {settings.WRITE_BEHIND_DEAD_LETTER_PATH}")
+        async with aiofiles.open(settings.WRITE_BEHIND_DEAD_LETTER_PATH, "a") as f:
+            for module, values in batch:
+                await f.write(json.dumps({"module": module, "values": values}, default=str) + "\n")
+
+write_behind = WriteBehindQueue()
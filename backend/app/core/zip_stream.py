@@ -0,0 +1,92 @@
+"""
+ZIP archives built while they are being sent
+
+zipfile writes into a small non-seekable buffer (local headers with data
+descriptors, so nothing is rewritten afterwards) that is drained after every
+file chunk. Files are read in UPLOAD_CHUNK_SIZE chunks; formats that are
+already compressed are STORED instead of deflated again. Memory use is one
+chunk plus the central directory, whatever the number of files.
+"""
+import os
+import zipfile
+from datetime import datetime
+from typing import AsyncIterable, AsyncIterator, Optional, Tuple
+import aiofiles.os
+from app.core.file_serving import read_file_range
+from app.core.storage import resolve_upload_path
+
+# Deflating these again costs CPU for (next to) no size gain
+STORED_EXTENSIONS = {
+    ".pdf", ".docx", ".xlsx", ".pptx",
+    ".jpg", ".jpeg", ".png", ".gif", ".webp",
+    ".zip", ".gz",
+}
+
+class _StreamBuffer:
+    """
+    Write-only, non-seekable file object; drain() hands out what was written so far
+    """
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+def compress_type(filename: str) -> int:
+    if os.path.splitext(filename)[1].lower() in STORED_EXTENSIONS:
+        return zipfile.ZIP_STORED
+    return zipfile.ZIP_DEFLATED
+
+async def stream_zip(entries: AsyncIterable[Tuple[str, str, Optional[datetime]]]) -> AsyncIterator[bytes]:
+    """
+    ZIP archive of (archive name, stored relative path, timestamp) entries, as byte chunks
+    Entries whose file is missing on disk are skipped.
+    """
+    buffer = _StreamBuffer()
+    names = set()
+    added = 0
+
+    with zipfile.ZipFile(buffer, mode="w", allowZip64=True) as archive:
+        async for arcname, relative_path, modified in entries:
+            path = resolve_upload_path(relative_path)
+            try:
+                stat = await aiofiles.os.stat(path)
+            except FileNotFoundError:
+                print(f"⚠️ Missing file skipped in bundle: {relative_path}")
+                continue
+
+            # Keep archive names unique (same original name in one project, ...)
+            base, extension = os.path.splitext(arcname)
+            suffix = 1
+            while arcname in names:
+                suffix += 1
+                arcname = f"{base} ({suffix}){extension}"
+            names.add(arcname)
+
+            info = zipfile.ZipInfo(
+                arcname,
+                date_time=(modified or datetime.fromtimestamp(stat.st_mtime)).timetuple()[:6]
+            )
+            info.compress_type = compress_type(arcname)
+            info.file_size = stat.st_size
+
+            with archive.open(info, mode="w") as entry:
+                async for chunk in read_file_range(path, 0, stat.st_size):
+                    entry.write(chunk)
+                    data = buffer.drain()
+                    if data:
+                        yield data
+            added += 1
+
+    # Data descriptor of the last entry + central directory
+    yield buffer.drain()
+    print(f"📦 Bundle streamed: {added} files")
@@ -1,21 +1,51 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, DDL, Index
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-# Create database engine
+# Create database engine (sync - used by scripts like init_db.py / reset_database.py)
 engine = create_engine(settings.DATABASE_URL, pool_pre_ping=True)
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Create async database engine (asyncpg - used by the API routes)
+async_engine = create_async_engine(
+    settings.ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+)
+
+# Create AsyncSessionLocal class
+# expire_on_commit=False so returned objects can still be serialized after commit
+# (lazy loading is not possible on an AsyncSession)
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Create Base class
 Base = declarative_base()
 
+# Trigram indexes (fuzzy/substring filters and /autocomplete) need pg_trgm
+event.listen(Base.metadata, "before_create", DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+
+def trigram_index(table_name: str, column: str) -> Index:
+    """
+    GIN trigram index - serves ILIKE '%...%' and similarity (%) lookups on column
+    """
+    return Index(
+        f"ix_{table_name}_{column}_trgm",
+        column,
+        postgresql_using="gin",
+        postgresql_ops={column: "gin_trgm_ops"}
+    )
+
 # Dependency to get DB session
-def get_db():
-    db = SessionLocal()
-    try:
+async def get_db():
+    async with AsyncSessionLocal() as db:
         yield db
-    finally:
-        db.close()
\ No newline at end of file
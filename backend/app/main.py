@@ -9,31 +9,21 @@ from datetime import datetime
 
 from app.core.config import settings
 from app.api.routes import router
-from app.database import engine
+from app.api.export import router as export_router
+from app.api.imports import router as import_router
+from app.api.search import router as search_router
+from app.api.bundles import router as bundle_router
+from app.database import async_engine
+from app.core.storage import create_upload_directories
+from app.core.sniffing import check_upload_settings
+from app.core.rate_limit import RateLimitMiddleware
+from app.core.body_limit import RequestBodyLimitMiddleware
+from app.core.write_behind import write_behind
 from app.models.job_application import Base
 from app.models.project_request import Base
 from app.models.product_inquiry import Base
-
-app = FastAPI(
-    title=settings.APP_NAME,
-    version=settings.APP_VERSION,
-    docs_url="/docs" if settings.DEBUG else None,
-    redoc_url="/redoc" if settings.DEBUG else None,
-)
-
-# Configure CORS - Add more origins for flexibility
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=[
-        "http://localhost:5173",  # Vite dev server
-        "http://localhost:5174",  # Alternative Vite port
-        "http://127.0.0.1:5173",  # Vite with IP
-        "http://localhost:3000",  # Create React App
-    ],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
+from app.models.stored_file import Base
+from app.models.lead_counter import Base
 
 # Configure logging
 logging.basicConfig(
@@ -50,17 +40,59 @@ async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application...")
     
+    # Refuse to start with an allowed upload type that cannot be content-checked
+    check_upload_settings()
+    
+    # Create upload directories once, instead of on every write
+    await create_upload_directories()
+    
     # Create database tables
     try:
-        Base.metadata.create_all(bind=engine)
+        async with async_engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
         logger.info("Database tables created/verified")
     except Exception as e:
         logger.error(f"Error creating database tables: {e}")
     
+    if settings.WRITE_BEHIND_ENABLED:
+        await write_behind.start()
+    
     yield
     
     # Shutdown
     logger.info("Shutting down application...")
+    # Flush queued submissions before the engine goes away
+    await write_behind.stop()
+    await async_engine.dispose()
+
+app = FastAPI(
+    title=settings.APP_NAME,
+    version=settings.APP_VERSION,
+    docs_url="/docs" if settings.DEBUG else None,
+    redoc_url="/redoc" if settings.DEBUG else None,
+    lifespan=lifespan,
+)
+
+# Per-IP rate limits for submission endpoints (added before CORS so 429s still get CORS headers)
+app.add_middleware(RateLimitMiddleware)
+
+# 413 for upload bodies over their limit, before Starlette spools them to disk
+app.add_middleware(RequestBodyLimitMiddleware)
+
+# Configure CORS - Add more origins for flexibility
+app.add_middleware(
+    CORSMiddleware,
+    allow_origins=[
+        "http://localhost:5173",  # Vite dev server
+        "http://localhost:5174",  # Alternative Vite port
+        "http://127.0.0.1:5173",  # Vite with IP
+        "http://localhost:3000",  # Create React App
+    ],
+    allow_credentials=True,
+    allow_methods=["*"],
+    allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "ETag", "Last-Modified"],
+)
 
 # Add trusted host middleware for production
 if not settings.DEBUG:
@@ -71,6 +103,10 @@ if not settings.DEBUG:
 
 # Include routers
 app.include_router(router, prefix="/api/v1", tags=["api"])
+app.include_router(export_router, prefix="/api/v1", tags=["export"])
+app.include_router(import_router, prefix="/api/v1", tags=["import"])
+app.include_router(search_router, prefix="/api/v1", tags=["search"])
+app.include_router(bundle_router, prefix="/api/v1", tags=["download"])
 
 # Root endpoint
 @app.get("/")
@@ -1,9 +1,11 @@
 # models/contact.py
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Index, Computed
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
-from app.database import Base
+from app.database import Base, trigram_index
 
 class ContactSubject(str, enum.Enum):
     general = "general"
@@ -15,9 +17,21 @@ class ContactSubject(str, enum.Enum):
 class ContactInquiry(Base):
     __tablename__ = "contact_inquiries"
 
+    __table_args__ = (
+        # Rate limit: email = ? AND ip_address = ? AND created_at >= ?
+        Index("ix_contact_inquiries_email_ip_created_at", "email", "ip_address", "created_at"),
+        # Full-text search (/search)
+        Index("ix_contact_inquiries_search_vector", "search_vector", postgresql_using="gin"),
+        # Autocomplete
+        trigram_index("contact_inquiries", "name"),
+        trigram_index("contact_inquiries", "email"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    # Idempotency key of submissions written through the write-behind queue
+    submission_id = Column(String(36), unique=True, nullable=True)
     name = Column(String(100), nullable=False)
-    email = Column(String(255), nullable=False, index=True)
+    email = Column(String(255), nullable=False)
     phone = Column(String(30), nullable=True)
     subject = Column(Enum(ContactSubject), nullable=False, default=ContactSubject.general)
     message = Column(Text, nullable=False)
@@ -29,6 +43,13 @@ class ContactInquiry(Base):
     # Timestamps
     created_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    # Search document for /search (generated column, deferred)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(message, '')), 'B')",
+        persisted=True
+    )))
 
     def __repr__(self):
         return f"<ContactInquiry {self.name} - {self.subject}>"
\ No newline at end of file
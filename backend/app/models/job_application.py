@@ -1,8 +1,10 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLAlchemyEnum, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum as SQLAlchemyEnum, Boolean, Index, Computed, text
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
-from app.database import Base
+from app.database import Base, trigram_index
 
 # Define enums with all lowercase values
 class JobType(str, enum.Enum):
@@ -25,22 +27,40 @@ class ApplicationStatus(str, enum.Enum):
 class JobApplication(Base):
     __tablename__ = "job_applications"
     
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_job_applications_created_at_id", "created_at", "id"),
+        # Daily application limit: email = ? AND created_at >= ?
+        Index("ix_job_applications_email_created_at", "email", "created_at"),
+        # Admin listing / stats only ever look at active applications
+        Index("ix_job_applications_active_status_created_at", "status", "created_at",
+              postgresql_where=text("is_active")),
+        Index("ix_job_applications_active_department", "department",
+              postgresql_where=text("is_active")),
+        # Full-text search (/search)
+        Index("ix_job_applications_search_vector", "search_vector", postgresql_using="gin"),
+        # Autocomplete
+        trigram_index("job_applications", "full_name"),
+        trigram_index("job_applications", "email"),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
     
     # Basic Information (from your form)
     full_name = Column(String(200), nullable=False)
-    email = Column(String(200), nullable=False, index=True)
+    email = Column(String(200), nullable=False)
     phone = Column(String(50), nullable=False)
     linkedin_url = Column(String(500))
     github_url = Column(String(500))
     portfolio_url = Column(String(500))
     years_of_experience = Column(String(50))
-    cover_letter = Column(Text)
+    # Heavy columns are deferred: loaded only with undefer_group("heavy") or when requested
+    cover_letter = deferred(Column(Text), group="heavy")
     
     # Job Details
     job_title = Column(String(200), nullable=False)
     job_type = Column(SQLAlchemyEnum(JobType), default=JobType.FULL_TIME)
-    department = Column(String(100), index=True)
+    department = Column(String(100))
     
     # Application Files
     resume_path = Column(String(500), nullable=False)
@@ -50,11 +70,19 @@ class JobApplication(Base):
     
     # System Fields
     ip_address = Column(String(50))
-    user_agent = Column(Text)
+    user_agent = deferred(Column(Text), group="heavy")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Weighted search document (A: names/titles, B: free text), maintained by Postgres;
+    # deferred so regular queries do not load it
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(job_title, '') || ' ' || coalesce(full_name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(cover_letter, '')), 'B')",
+        persisted=True
+    )))
+    
     # Metadata
     application_id = Column(String(50), unique=True, index=True)
     
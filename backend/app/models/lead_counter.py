@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+class LeadCounter(Base):
+    """
+    Rollup counters for the stats endpoints, maintained in the write path
+    e.g. (product_inquiries, status, pending) or (product_inquiries, day, 2026-10-18)
+    """
+    __tablename__ = "lead_counters"
+    
+    module = Column(String(50), primary_key=True)      # job_applications, project_requests, ...
+    dimension = Column(String(30), primary_key=True)   # status, product, employees, day
+    bucket = Column(String(200), primary_key=True)     # value of the dimension
+    count = Column(BigInteger, nullable=False, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<LeadCounter {self.module}.{self.dimension}={self.bucket}: {self.count}>"
@@ -1,17 +1,35 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, Boolean, Index, Computed
+from sqlalchemy.orm import deferred
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
-from app.database import Base
+from app.database import Base, trigram_index
 
 class ProductInquiry(Base):
     __tablename__ = "product_inquiries"
     
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_product_inquiries_created_at_id", "created_at", "id"),
+        # Duplicate check: email = ? AND product = ? AND created_at >= ?
+        Index("ix_product_inquiries_email_product_created_at", "email", "product", "created_at"),
+        # Full-text search (/search)
+        Index("ix_product_inquiries_search_vector", "search_vector", postgresql_using="gin"),
+        # Substring filters / autocomplete
+        trigram_index("product_inquiries", "product"),
+        trigram_index("product_inquiries", "company"),
+        trigram_index("product_inquiries", "name"),
+        trigram_index("product_inquiries", "email"),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
+    # Idempotency key of submissions written through the write-behind queue
+    submission_id = Column(String(36), unique=True, nullable=True)
     name = Column(String(100), nullable=False)
     email = Column(String(100), nullable=False)
     phone = Column(String(20), nullable=False)
     company = Column(String(100), nullable=False)
     product = Column(String(100), nullable=False)
-    message = Column(Text)
+    message = deferred(Column(Text), group="heavy")
     
     # Additional fields
     status = Column(String(20), default="pending")  # pending, contacted, closed
@@ -21,17 +39,35 @@ class ProductInquiry(Base):
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Search document for /search (generated column, deferred)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(product, '') || ' ' || coalesce(company, '') || ' ' || coalesce(name, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(message, '')), 'B')",
+        persisted=True
+    )))
+    
     # Tracking
     ip_address = Column(String(45))
-    user_agent = Column(Text)
+    user_agent = deferred(Column(Text), group="heavy")
     source = Column(String(50), default="website")  # website, mobile, api
 
 class FreeTrialRequest(Base):
     __tablename__ = "free_trial_requests"
 
+    __table_args__ = (
+        # Duplicate check: email = ? AND created_at >= ?
+        Index("ix_free_trial_requests_email_created_at", "email", "created_at"),
+        # Autocomplete
+        trigram_index("free_trial_requests", "company"),
+        trigram_index("free_trial_requests", "name"),
+        trigram_index("free_trial_requests", "email"),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
+    # Idempotency key of submissions written through the write-behind queue
+    submission_id = Column(String(36), unique=True, nullable=True)
     name = Column(String, nullable=False)
-    email = Column(String, nullable=False, index=True)
+    email = Column(String, nullable=False)
     phone = Column(String, nullable=False)
     company = Column(String, nullable=False)
     employees = Column(String)
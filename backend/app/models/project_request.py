@@ -1,9 +1,10 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Boolean, JSON
+from sqlalchemy import Column, Integer, String, Text, DateTime, Enum, Boolean, JSON, Index, Computed
+from sqlalchemy.orm import deferred
 from sqlalchemy.sql import func
 from datetime import datetime
 import enum
-from app.database import Base
-from sqlalchemy.dialects.postgresql import JSONB
+from app.database import Base, trigram_index
+from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
 
 
 class ProjectStatus(str, enum.Enum):
@@ -19,15 +20,29 @@ class ProjectStatus(str, enum.Enum):
 class ProjectRequest(Base):
     __tablename__ = "project_requests"
     
+    __table_args__ = (
+        # Keyset pagination: ORDER BY created_at DESC, id DESC
+        Index("ix_project_requests_created_at_id", "created_at", "id"),
+        # Full-text search (/search)
+        Index("ix_project_requests_search_vector", "search_vector", postgresql_using="gin"),
+        # Autocomplete
+        trigram_index("project_requests", "company"),
+        trigram_index("project_requests", "full_name"),
+        trigram_index("project_requests", "email"),
+        # Technology filter: technologies @> '["React"]'
+        Index("ix_project_requests_technologies", "technologies",
+              postgresql_using="gin", postgresql_ops={"technologies": "jsonb_path_ops"}),
+    )
+    
     id = Column(Integer, primary_key=True, index=True)
     
     # Project Information
     project_id = Column(String(50), unique=True, index=True, nullable=False)
     project_type = Column(String(200), nullable=False)
-    description = Column(Text, nullable=False)
+    description = deferred(Column(Text, nullable=False), group="heavy")
     budget = Column(String(100))
     timeline = Column(String(100))
-    technologies = Column(JSONB, nullable=True)  # JSON string of selected technologies
+    technologies = Column(JSONB, nullable=True)  # JSON array of selected technologies
     
     # Client Information
     full_name = Column(String(200), nullable=False)
@@ -36,18 +51,25 @@ class ProjectRequest(Base):
     company = Column(String(200))
     
     # Files
-    attached_files = Column(JSONB, nullable=True)# JSON string of file information
+    attached_files = deferred(Column(JSONB, nullable=True), group="heavy")  # JSON array of file metadata objects
     
     # Status
     status = Column(Enum(ProjectStatus), default=ProjectStatus.NEW)
-    notes = Column(Text)
+    notes = deferred(Column(Text), group="heavy")
     
     # System Fields
     ip_address = Column(String(50))
-    user_agent = Column(Text)
+    user_agent = deferred(Column(Text), group="heavy")
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
+    # Search document for /search (generated column, deferred)
+    search_vector = deferred(Column(TSVECTOR, Computed(
+        "setweight(to_tsvector('english', coalesce(project_type, '') || ' ' || coalesce(full_name, '') || ' ' || coalesce(company, '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(description, '')), 'B')",
+        persisted=True
+    )))
+    
     def __repr__(self):
         return f"<ProjectRequest {self.project_id} - {self.full_name}>"
\ No newline at end of file
@@ -0,0 +1,20 @@
+from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy.sql import func
+from app.database import Base
+
+class StoredFile(Base):
+    __tablename__ = "stored_files"
+    
+    # Relative path inside UPLOAD_DIR ("resumes/<sha256>.pdf")
+    path = Column(String(500), primary_key=True)
+    sha256 = Column(String(64), nullable=False, index=True)
+    size = Column(Integer, nullable=False)
+    
+    # Number of JobApplication.resume_path / ProjectRequest.attached_files entries pointing here
+    ref_count = Column(Integer, nullable=False, default=0)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), onupdate=func.now())
+    
+    def __repr__(self):
+        return f"<StoredFile {self.path} ({self.ref_count} refs)>"
@@ -68,5 +68,7 @@ class ApplicationStats(BaseModel):
     pending: int
     reviewed: int
     shortlisted: int
+    interview_scheduled: int
     hired: int
-    rejected: int
\ No newline at end of file
+    rejected: int
+    withdrawn: int
\ No newline at end of file
@@ -54,36 +54,11 @@ class ProjectRequestResponse(BaseModel):
     notes: Optional[str] = None
     created_at: datetime
 
-    @field_validator("technologies", "attached_files", mode="before")
+    @field_validator("technologies", mode="before")
     @classmethod
-    def parse_json_fields(cls, value, info):
-        field_name = info.field_name
-
-        # अगर value already list/dict है (या None), तो वैसा ही return करो
-        if value is None:
-            return None if field_name == "attached_files" else []
-        if not isinstance(value, str):
-            return value
-
-        # String है → JSON parse करो
-        try:
-            parsed = json.loads(value)
-
-            if field_name == "technologies":
-                return parsed if isinstance(parsed, list) else []
-            elif field_name == "attached_files":
-                return parsed if isinstance(parsed, list) else []
-
-        except json.JSONDecodeError:
-            pass  # नीचे default return
-
-        # Parse fail → default safe value
-        if field_name == "technologies":
-            return []
-        elif field_name == "attached_files":
-            return []  # या None अगर Optional है
-
-        return value
+    def default_technologies(cls, value):
+        # Columns are native JSONB arrays; only NULL needs a default
+        return value if value is not None else []
 
     model_config = {"from_attributes": True}  # Pydantic V2 style (Config class deprecated)
 
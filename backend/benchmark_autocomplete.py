@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Measure /autocomplete query latency keystroke by keystroke against the configured database
+(uncached), and check it against a per-keystroke budget.
+
+    python benchmark_autocomplete.py company "Acme Corporation"
+    python benchmark_autocomplete.py email "john.smith@" --budget-ms 30
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.api.search import AUTOCOMPLETE_FIELDS, query_suggestions
+
+async def main(field: str, text: str, budget_ms: float, repeat: int):
+    print(f"⏱️ Autocomplete benchmark: {field} = '{text}' (budget {budget_ms}ms per keystroke)")
+    
+    slowest = 0.0
+    try:
+        async with AsyncSessionLocal() as db:
+            # Warm up the connection and plan cache
+            await query_suggestions(db, field, text[:1], 10)
+            
+            for length in range(1, len(text) + 1):
+                prefix = text[:length]
+                timings = []
+                for _ in range(repeat):
+                    started = time.perf_counter()
+                    suggestions = await query_suggestions(db, field, prefix, 10)
+                    timings.append((time.perf_counter() - started) * 1000)
+                
+                timings.sort()
+                median = timings[len(timings) // 2]
+                slowest = max(slowest, median)
+                marker = "✅" if median <= budget_ms else "❌"
+                print(f"{marker} '{prefix}': {median:.1f}ms median, {len(suggestions)} suggestions")
+    finally:
+        await async_engine.dispose()
+    
+    if slowest > budget_ms:
+        print(f"❌ Slowest keystroke {slowest:.1f}ms exceeds the {budget_ms}ms budget")
+        sys.exit(1)
+    print(f"✅ All keystrokes within budget (slowest {slowest:.1f}ms)")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Autocomplete latency benchmark")
+    parser.add_argument("field", choices=list(AUTOCOMPLETE_FIELDS))
+    parser.add_argument("text", help="value typed one keystroke at a time")
+    parser.add_argument("--budget-ms", type=float, default=50.0)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.field, args.text, args.budget_ms, args.repeat))
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Latency of one lead insert against the configured database, before and after
+single-round-trip inserts:
+
+- before: rate-limit COUNT, INSERT, COMMIT, then SELECT (db.refresh)
+- after:  guarded INSERT ... SELECT ... WHERE <limit> RETURNING, COMMIT
+
+The benchmark rows (emails @benchmark.invalid) are deleted afterwards.
+
+    python benchmark_inserts.py --count 200
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+import uuid
+from datetime import timedelta
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import delete, func, select
+from app.core.config import settings
+from app.core.inserts import insert_returning, under_rate
+from app.core.rate_limit import parse_rate
+from app.database import AsyncSessionLocal, async_engine
+from app.models.contact import ContactInquiry, ContactSubject
+
+BENCHMARK_DOMAIN = "benchmark.invalid"
+CLIENT_IP = "192.0.2.1"
+
+def lead_values() -> dict:
+    return {
+        "name": "Benchmark Lead",
+        "email": f"{uuid.uuid4().hex[:12]}@{BENCHMARK_DOMAIN}",
+        "phone": "+15550100000",
+        "subject": ContactSubject.general,
+        "message": "Latency benchmark row",
+        "ip_address": CLIENT_IP,
+        "user_agent": "benchmark_inserts.py",
+    }
+
+async def insert_before(db, values: dict):
+    limit, window = parse_rate(settings.RATE_LIMIT_CONTACT)
+    recent = await db.scalar(
+        select(func.count()).select_from(ContactInquiry).where(
+            ContactInquiry.email == values["email"],
+            ContactInquiry.ip_address == CLIENT_IP,
+            ContactInquiry.created_at >= func.now() - timedelta(seconds=window)
+        )
+    )
+    if recent >= limit:
+        raise RuntimeError("Rate limit hit during benchmark")
+
+    inquiry = ContactInquiry(**values)
+    db.add(inquiry)
+    await db.commit()
+    await db.refresh(inquiry)
+
+async def insert_after(db, values: dict):
+    inserted = await insert_returning(
+        db,
+        ContactInquiry,
+        values,
+        guard=under_rate(ContactInquiry, settings.RATE_LIMIT_CONTACT, email=values["email"], ip_address=CLIENT_IP)
+    )
+    if inserted is None:
+        raise RuntimeError("Rate limit hit during benchmark")
+    await db.commit()
+
+async def measure(label: str, func, count: int) -> float:
+    timings = []
+    async with AsyncSessionLocal() as db:
+        await func(db, lead_values())  # warm up
+        for _ in range(count):
+            values = lead_values()
+            started = time.perf_counter()
+            await func(db, values)
+            timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    median = timings[len(timings) // 2]
+    p95 = timings[int(len(timings) * 0.95) - 1]
+    print(f"{label}: {median:.2f}ms median, {p95:.2f}ms p95")
+    return median
+
+async def main(count: int):
+    print(f"⏱️ Inserting {count} contact inquiries per path")
+
+    try:
+        before = await measure("COUNT + INSERT + COMMIT + refresh", insert_before, count)
+        after = await measure("Guarded INSERT ... RETURNING + COMMIT", insert_after, count)
+        print(f"✅ {before / after:.1f}x lower median latency")
+    finally:
+        async with AsyncSessionLocal() as db:
+            await db.execute(delete(ContactInquiry).where(ContactInquiry.email.like(f"%@{BENCHMARK_DOMAIN}")))
+            await db.commit()
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Lead insert latency benchmark")
+    parser.add_argument("--count", type=int, default=200)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.count))
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Throughput of concurrent requests inside one event loop (one uvicorn worker),
+against the configured database:
+
+- blocking: sync Session queries called from async handlers (the old get_db)
+- async:    AsyncSession over asyncpg (the current get_db)
+
+Each simulated request runs the /applications page query; --sleep-ms adds a
+server-side pg_sleep round trip to model a slower query. Event-loop lag is sampled
+meanwhile: with the blocking path every query stalls all other requests.
+
+    python benchmark_load.py --requests 2000 --concurrency 100 --sleep-ms 5
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, select
+from app.core.pagination import paginate
+from app.database import SessionLocal, engine, AsyncSessionLocal, async_engine
+from app.models.job_application import JobApplication
+
+def request_queries(sleep_ms: float):
+    queries = [paginate(
+        select(JobApplication.id, JobApplication.full_name, JobApplication.created_at).where(
+            JobApplication.is_active == True
+        ),
+        JobApplication,
+        20
+    )]
+    if sleep_ms:
+        queries.insert(0, select(func.pg_sleep(sleep_ms / 1000)))
+    return queries
+
+async def blocking_request(queries):
+    # What the handlers did before: a sync Session inside async def
+    db = SessionLocal()
+    try:
+        for query in queries:
+            db.execute(query).all()
+    finally:
+        db.close()
+
+async def async_request(queries):
+    async with AsyncSessionLocal() as db:
+        for query in queries:
+            (await db.execute(query)).all()
+
+async def watch_loop_lag(stop: asyncio.Event, lags: list):
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(0.01)
+        lags.append((loop.time() - started - 0.01) * 1000)
+
+async def run(label: str, handler, requests: int, concurrency: int, sleep_ms: float) -> float:
+    queries = request_queries(sleep_ms)
+    remaining = iter(range(requests))
+    latencies = []
+
+    async def client():
+        for _ in remaining:
+            started = time.perf_counter()
+            await handler(queries)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await handler(queries)  # warm up the pool
+
+    stop, lags = asyncio.Event(), []
+    watcher = asyncio.create_task(watch_loop_lag(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*[client() for _ in range(concurrency)])
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await watcher
+
+    latencies.sort()
+    throughput = requests / elapsed
+    print(
+        f"{label}: {throughput:.0f} req/s, "
+        f"p50 {latencies[len(latencies) // 2]:.1f}ms, p99 {latencies[int(len(latencies) * 0.99) - 1]:.1f}ms, "
+        f"max loop lag {max(lags, default=0):.1f}ms"
+    )
+    return throughput
+
+async def main(requests: int, concurrency: int, sleep_ms: float):
+    print(f"⏱️ {requests} requests, {concurrency} concurrent, +{sleep_ms}ms per query")
+
+    try:
+        before = await run("Blocking Session", blocking_request, requests, concurrency, sleep_ms)
+        after = await run("AsyncSession (asyncpg)", async_request, requests, concurrency, sleep_ms)
+        print(f"✅ {after / before:.1f}x throughput with the async path")
+    finally:
+        await async_engine.dispose()
+        engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync vs async database load benchmark")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--sleep-ms", type=float, default=5.0)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.requests, args.concurrency, args.sleep_ms))
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+Cost of /applications/stats on a large job_applications table (configured database):
+
+- one COUNT(*) per status (the original endpoint)
+- one pass with a count(*) FILTER (WHERE status = ...) per status
+- the lead_counters rollup the endpoint reads today
+
+The table is seeded with synthetic applications (1,000,000 by default) in a
+transaction that is rolled back at the end.
+
+    python benchmark_stats.py --rows 1000000 --repeat 5
+"""
+import sys
+import os
+import argparse
+import asyncio
+import time
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import func, select, text
+from app.core import counters
+from app.database import AsyncSessionLocal, async_engine
+from app.models.job_application import JobApplication, ApplicationStatus
+from check_indexes import seed_applications
+
+async def count_per_status(db):
+    return {
+        application_status.value: await db.scalar(
+            select(func.count()).select_from(JobApplication).where(
+                JobApplication.is_active == True,
+                JobApplication.status == application_status
+            )
+        )
+        for application_status in ApplicationStatus
+    }
+
+async def filter_aggregates(db):
+    row = (await db.execute(
+        select(
+            func.count(),
+            *[
+                func.count().filter(JobApplication.status == application_status)
+                for application_status in ApplicationStatus
+            ]
+        ).where(JobApplication.is_active == True)
+    )).one()
+    return dict(zip(["total", *[s.value for s in ApplicationStatus]], row))
+
+async def rollup(db):
+    return (await counters.read_counters(db, [counters.JOB_APPLICATIONS]))[counters.JOB_APPLICATIONS]
+
+async def measure(db, label: str, func, repeat: int) -> float:
+    await func(db)  # warm up
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        await func(db)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    median = timings[len(timings) // 2]
+    print(f"{label}: {median:.1f}ms median")
+    return median
+
+async def main(rows: int, repeat: int):
+    print(f"🌱 Seeding {rows:,} applications (rolled back at the end)...")
+
+    try:
+        async with AsyncSessionLocal() as db:
+            await seed_applications(db, rows)
+            await db.execute(text(f"ANALYZE {JobApplication.__tablename__}"))
+
+            before = await measure(db, f"{len(ApplicationStatus)} x COUNT(*)", count_per_status, repeat)
+            single = await measure(db, "1 x FILTER aggregates", filter_aggregates, repeat)
+            current = await measure(db, "lead_counters rollup", rollup, repeat)
+            print(f"✅ Single pass {before / single:.1f}x faster, rollup {before / current:.0f}x faster than per-status counts")
+
+            await db.rollback()
+    finally:
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Application stats benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    asyncio.run(main(args.rows, args.repeat))
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN the rate-limit, listing and filter queries against the configured database
+and check that each one is answered by its index (Index Scan / Index Only Scan /
+Bitmap Index Scan on the expected index).
+
+The tables are first seeded with synthetic rows (1,000,000 per table by default)
+and analyzed inside one transaction that is rolled back at the end, so the plans
+are those of a large table and nothing is left behind.
+
+    python check_indexes.py
+    python check_indexes.py --rows 200000
+"""
+import sys
+import os
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime, timedelta, timezone
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import case, cast, func, insert, literal, literal_column, select, text
+from sqlalchemy.dialects.postgresql import array
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.expression import ClauseElement, Executable
+from app.core.config import settings
+from app.core.inserts import under_rate
+from app.core.pagination import encode_cursor, paginate
+from app.database import AsyncSessionLocal, async_engine
+from app.models.job_application import JobApplication, ApplicationStatus
+from app.models.product_inquiry import ProductInquiry, FreeTrialRequest
+from app.models.contact import ContactInquiry, ContactSubject
+
+INDEX_NODES = {"Index Scan", "Index Only Scan", "Bitmap Index Scan"}
+
+DEPARTMENTS = ["Engineering", "Design", "Marketing", "Sales", "Operations", "Support"]
+RARE_DEPARTMENT = "Legal"  # 0.1% of the seeded applications
+PRODUCTS = ["CRM Suite", "HR Cloud", "Inventory Pro", "Analytics Hub", "Payroll Plus"]
+
+class Explain(Executable, ClauseElement):
+    """
+    EXPLAIN (FORMAT JSON) <statement>, executed with the statement's own bound parameters
+    """
+    inherit_cache = False
+
+    def __init__(self, statement):
+        self.statement = statement
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element, compiler, **kw):
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+def _pick(values, n):
+    # values[n % len(values)] as SQL (arrays are 1-based)
+    return array(values)[1 + n % len(values)]
+
+async def seed_applications(db, rows: int):
+    """
+    rows synthetic job applications (90% active, statuses and departments spread evenly,
+    plus a rare department)
+    """
+    series = func.generate_series(1, rows).table_valued("n")
+    n = series.c.n
+    await db.execute(insert(JobApplication.__table__).from_select(
+        ["full_name", "email", "phone", "job_title", "department", "resume_path", "status", "is_active", "created_at"],
+        select(
+            func.concat("Seed Applicant ", n),
+            func.concat("applicant", n, "@seed.invalid"),
+            literal("+15550100000"),
+            literal("Frontend Developer"),
+            case((n % 1000 == 0, RARE_DEPARTMENT), else_=_pick(DEPARTMENTS, n)),
+            literal("resumes/seed.pdf"),
+            cast(_pick([s.name for s in ApplicationStatus], n), JobApplication.status.type),
+            n % 10 != 0,
+            func.now() - n * literal_column("interval '1 minute'"),
+        ).select_from(series)
+    ))
+
+async def seed_leads(db, rows: int):
+    """
+    rows synthetic product inquiries, free trial requests and contact messages
+    """
+    series = func.generate_series(1, rows).table_valued("n")
+    n = series.c.n
+    created_at = func.now() - n * literal_column("interval '1 minute'")
+
+    await db.execute(insert(ProductInquiry.__table__).from_select(
+        ["name", "email", "phone", "company", "product", "status", "created_at"],
+        select(
+            func.concat("Seed Lead ", n),
+            func.concat("lead", n % (rows // 3 + 1), "@seed.invalid"),
+            literal("+15550100000"),
+            func.concat("Company ", n % 5000),
+            _pick(PRODUCTS, n),
+            literal("pending"),
+            created_at,
+        ).select_from(series)
+    ))
+    await db.execute(insert(FreeTrialRequest.__table__).from_select(
+        ["name", "email", "phone", "company", "status", "created_at"],
+        select(
+            func.concat("Seed Lead ", n),
+            func.concat("trial", n, "@seed.invalid"),
+            literal("+15550100000"),
+            func.concat("Company ", n % 5000),
+            literal("pending"),
+            created_at,
+        ).select_from(series)
+    ))
+    await db.execute(insert(ContactInquiry.__table__).from_select(
+        ["name", "email", "subject", "message", "ip_address", "created_at"],
+        select(
+            func.concat("Seed Lead ", n),
+            func.concat("contact", n % (rows // 2 + 1), "@seed.invalid"),
+            cast(_pick([s.name for s in ContactSubject], n), ContactInquiry.subject.type),
+            literal("Seeded message"),
+            func.concat("10.0.", n % 250, ".", n % 200),
+            created_at,
+        ).select_from(series)
+    ))
+
+def plan_indexes(plan: dict):
+    """
+    (node type, index name) of every index access in a JSON plan tree
+    """
+    if plan.get("Node Type") in INDEX_NODES:
+        yield plan["Node Type"], plan.get("Index Name")
+    for child in plan.get("Plans", []):
+        yield from plan_indexes(child)
+
+def checked_queries():
+    """
+    (label, statement, expected index) for the hot queries, built with the app's own helpers
+    """
+    active = select(JobApplication.id, JobApplication.created_at).where(JobApplication.is_active == True)
+    cursor = encode_cursor(datetime.now(timezone.utc) - timedelta(days=30), 10**9)
+    listing = lambda model: select(model.id, model.created_at)
+
+    return [
+        ("Daily application limit (email, created_at)",
+         select(under_rate(JobApplication, f"{settings.MAX_APPLICATIONS_PER_DAY}/day", email="applicant42@seed.invalid")),
+         "ix_job_applications_email_created_at"),
+        ("Applications by status (active)",
+         paginate(active.where(JobApplication.status == ApplicationStatus.SHORTLISTED), JobApplication, 20),
+         "ix_job_applications_active_status_created_at"),
+        ("Applications by department (active)",
+         select(func.count()).select_from(JobApplication).where(
+             JobApplication.is_active == True, JobApplication.department == RARE_DEPARTMENT
+         ),
+         "ix_job_applications_active_department"),
+        ("Applications page after cursor",
+         paginate(listing(JobApplication), JobApplication, 20, cursor=cursor),
+         "ix_job_applications_created_at_id"),
+        ("Inquiry limit (email, product, created_at)",
+         select(under_rate(ProductInquiry, settings.RATE_LIMIT_INQUIRY, email="lead42@seed.invalid", product=PRODUCTS[0])),
+         "ix_product_inquiries_email_product_created_at"),
+        ("Inquiries page after cursor",
+         paginate(listing(ProductInquiry), ProductInquiry, 20, cursor=cursor),
+         "ix_product_inquiries_created_at_id"),
+        ("Trial limit (email, created_at)",
+         select(under_rate(FreeTrialRequest, settings.RATE_LIMIT_TRIAL, email="trial42@seed.invalid")),
+         "ix_free_trial_requests_email_created_at"),
+        ("Contact limit (email, ip_address, created_at)",
+         select(under_rate(ContactInquiry, settings.RATE_LIMIT_CONTACT, email="contact42@seed.invalid", ip_address="10.0.42.42")),
+         "ix_contact_inquiries_email_ip_created_at"),
+    ]
+
+async def main(rows: int) -> bool:
+    print(f"🌱 Seeding {rows:,} rows per table (rolled back at the end)...")
+    passed = True
+
+    try:
+        async with AsyncSessionLocal() as db:
+            started = time.perf_counter()
+            await seed_applications(db, rows)
+            await seed_leads(db, rows)
+            for model in (JobApplication, ProductInquiry, FreeTrialRequest, ContactInquiry):
+                await db.execute(text(f"ANALYZE {model.__tablename__}"))
+            print(f"✅ Seeded and analyzed in {time.perf_counter() - started:.1f}s")
+
+            for label, statement, expected in checked_queries():
+                plan = (await db.execute(Explain(statement))).scalar()
+                plan = json.loads(plan) if isinstance(plan, str) else plan
+                used = list(plan_indexes(plan[0]["Plan"]))
+
+                if any(name == expected for _, name in used):
+                    node = next(node for node, name in used if name == expected)
+                    print(f"✅ {label}: {node} on {expected}")
+                else:
+                    passed = False
+                    found = ", ".join(f"{node} on {name}" for node, name in used) or plan[0]["Plan"]["Node Type"]
+                    print(f"❌ {label}: expected {expected}, plan uses {found}")
+
+            await db.rollback()
+    finally:
+        await async_engine.dispose()
+
+    return passed
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Check that hot queries use their indexes")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    if not asyncio.run(main(args.rows)):
+        print("❌ Some queries do not use their index")
+        sys.exit(1)
+    print("✅ All checked queries use their index")
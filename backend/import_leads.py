@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+"""
+Bulk import historical leads (contacts, inquiries, trials) from a CSV or NDJSON file.
+
+    python import_leads.py inquiries leads.csv
+    python import_leads.py trials export.ndjson
+
+Rows are validated with the API schemas and loaded with COPY in batches of
+IMPORT_BATCH_SIZE; rejected rows are written to a report in IMPORT_REPORT_DIR.
+"""
+import sys
+import os
+import argparse
+import asyncio
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.core.bulk_import import IMPORTABLE, detect_format, import_leads
+
+async def main(dataset: str, path: str, file_format: str):
+    print(f"📥 Importing {dataset} from {path} ({file_format})...")
+    
+    try:
+        with open(path, "rb") as source:
+            async with AsyncSessionLocal() as db:
+                result = await import_leads(db, dataset, source, file_format)
+        print(f"✅ Imported {result['imported']} {dataset}")
+        if result["rejected"]:
+            print(f"⚠️ Rejected {result['rejected']} rows, see {result['report']}")
+    except Exception as e:
+        print(f"❌ Import failed: {e}")
+        sys.exit(1)
+    finally:
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Bulk import historical leads")
+    parser.add_argument("dataset", choices=list(IMPORTABLE))
+    parser.add_argument("path", help="CSV (with header row) or NDJSON file")
+    parser.add_argument("--format", choices=["csv", "ndjson"], help="defaults to the file extension")
+    args = parser.parse_args()
+    
+    asyncio.run(main(args.dataset, args.path, args.format or detect_format(args.path)))
@@ -13,6 +13,8 @@ from app.models.job_application import Base
 from app.models.project_request import Base
 from app.models.product_inquiry import Base
 from app.models.contact import Base
+from app.models.stored_file import Base
+from app.models.lead_counter import Base
 from app.core.config import settings
 
 def init_database():
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+Move existing uploads into the sharded, content-addressed layout
+(<category>/ab/cd/<sha256><ext>) and rewrite the stored paths in bulk.
+
+Files are hard-linked (or copied) to their new location first, the database
+is updated in a single transaction, and only then are the old files removed,
+so the app keeps working while this runs.
+
+Usage:
+    python migrate_uploads.py            # migrate
+    python migrate_uploads.py --dry-run  # only show what would happen
+"""
+import sys
+import os
+import json
+import shutil
+import hashlib
+from collections import Counter
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from sqlalchemy import text
+from app.database import engine
+from app.core.config import settings
+from app.core.storage import sharded_path
+
+CATEGORIES = ("resumes", "project_docs")
+
+def file_sha256(path) -> str:
+    """
+    SHA-256 of a file, read in chunks
+    """
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(settings.UPLOAD_CHUNK_SIZE), b""):
+            sha256.update(chunk)
+    return sha256.hexdigest()
+
+def plan_moves() -> dict:
+    """
+    Map old relative path -> {"path", "sha256", "size"} for every flat file
+    """
+    moves = {}
+    for category in CATEGORIES:
+        category_dir = settings.UPLOAD_DIR / category
+        if not category_dir.is_dir():
+            continue
+
+        for entry in os.scandir(category_dir):
+            # Files already in shard directories are skipped
+            if not entry.is_file() or entry.name.endswith(".part"):
+                continue
+
+            digest = file_sha256(entry.path)
+            extension = os.path.splitext(entry.name)[1]
+            moves[f"{category}/{entry.name}"] = {
+                "path": sharded_path(category, digest, extension),
+                "sha256": digest,
+                "size": entry.stat().st_size
+            }
+    return moves
+
+def link_files(moves: dict):
+    """
+    Make every file reachable under its new path (old path stays valid)
+    """
+    for old_path, target in moves.items():
+        source = settings.UPLOAD_DIR / old_path
+        destination = settings.UPLOAD_DIR / target["path"]
+        if destination.exists():
+            continue
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source, destination)
+        except OSError:
+            shutil.copy2(source, destination)
+
+def load_attached_files(value):
+    """
+    attached_files may be stored as a JSON string or as a JSON array
+    """
+    if isinstance(value, str):
+        try:
+            value = json.loads(value)
+        except json.JSONDecodeError:
+            return []
+    return value if isinstance(value, list) else []
+
+def rewrite_database(moves: dict):
+    """
+    Rewrite resume_path / attached_files and rebuild stored_files ref counts
+    """
+    with engine.begin() as conn:
+        # 1. Job applications - one UPDATE joined against a temp mapping table
+        conn.execute(text(
+            "CREATE TEMP TABLE upload_path_map (old_path VARCHAR(500) PRIMARY KEY, new_path VARCHAR(500)) "
+            "ON COMMIT DROP"
+        ))
+        if moves:
+            conn.execute(
+                text("INSERT INTO upload_path_map (old_path, new_path) VALUES (:old_path, :new_path)"),
+                [{"old_path": old, "new_path": new["path"]} for old, new in moves.items()]
+            )
+        result = conn.execute(text(
+            "UPDATE job_applications AS ja SET resume_path = m.new_path "
+            "FROM upload_path_map AS m WHERE ja.resume_path = m.old_path"
+        ))
+        print(f"   job_applications rows updated: {result.rowcount}")
+
+        # 2. Project requests - attached_files is a JSON document, rewrite it in Python
+        updates = []
+        for project_id, attached_files in conn.execute(text(
+            "SELECT id, attached_files FROM project_requests WHERE attached_files IS NOT NULL"
+        )):
+            files = load_attached_files(attached_files)
+            changed = False
+            for file_info in files:
+                target = moves.get(file_info.get("path"))
+                if target:
+                    file_info.update({
+                        "path": target["path"],
+                        "saved_name": os.path.basename(target["path"]),
+                        "sha256": target["sha256"]
+                    })
+                    changed = True
+            if changed:
+                updates.append({"id": project_id, "attached_files": json.dumps(files)})
+
+        if updates:
+            conn.execute(
+                text("UPDATE project_requests SET attached_files = CAST(:attached_files AS JSONB) WHERE id = :id"),
+                updates
+            )
+        print(f"   project_requests rows updated: {len(updates)}")
+
+        # 3. Reference counts, recomputed from what the tables now point at
+        conn.execute(text("DELETE FROM stored_files WHERE path IN (SELECT old_path FROM upload_path_map)"))
+        ref_counts = Counter(conn.execute(text(
+            "SELECT resume_path FROM job_applications WHERE resume_path IS NOT NULL"
+        )).scalars())
+        for (attached_files,) in conn.execute(text(
+            "SELECT attached_files FROM project_requests WHERE attached_files IS NOT NULL"
+        )):
+            ref_counts.update(f.get("path") for f in load_attached_files(attached_files) if f.get("path"))
+
+        by_new_path = {target["path"]: target for target in moves.values()}
+        stored_files = [
+            {"path": path, "sha256": by_new_path[path]["sha256"], "size": by_new_path[path]["size"], "ref_count": count}
+            for path, count in ref_counts.items() if path in by_new_path
+        ]
+        if stored_files:
+            conn.execute(
+                text(
+                    "INSERT INTO stored_files (path, sha256, size, ref_count) "
+                    "VALUES (:path, :sha256, :size, :ref_count) "
+                    "ON CONFLICT (path) DO UPDATE SET ref_count = EXCLUDED.ref_count"
+                ),
+                stored_files
+            )
+        print(f"   stored_files rows written: {len(stored_files)}")
+
+def remove_old_files(moves: dict):
+    """
+    Remove the flat copies once the database points at the new paths
+    """
+    for old_path in moves:
+        old_file = settings.UPLOAD_DIR / old_path
+        if old_file.exists():
+            old_file.unlink()
+
+def main():
+    dry_run = "--dry-run" in sys.argv
+
+    print("=" * 60)
+    print("UPLOADS MIGRATION - SHARDED CONTENT-ADDRESSED LAYOUT")
+    print("=" * 60)
+
+    print("\n🔍 Scanning upload directories...")
+    moves = plan_moves()
+    unique_targets = {target["path"] for target in moves.values()}
+    print(f"   Files found: {len(moves)} ({len(unique_targets)} unique)")
+
+    if dry_run:
+        for old_path, target in sorted(moves.items()):
+            print(f"   {old_path} -> {target['path']}")
+        print("\nDry run - nothing changed.")
+        return
+
+    try:
+        print("\n🔗 Linking files into shard directories...")
+        link_files(moves)
+
+        print("\n📝 Rewriting stored paths...")
+        rewrite_database(moves)
+
+        print("\n🧹 Removing old files...")
+        remove_old_files(moves)
+    except Exception as e:
+        print(f"❌ Migration failed: {e}")
+        sys.exit(1)
+
+    print("\n✅ Uploads migrated successfully!")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Recompute the lead_counters rollup behind the stats endpoints from scratch.
+Run it after bulk changes made outside the API, or whenever counts drift.
+"""
+import sys
+import os
+import asyncio
+
+# Add the app directory to the Python path
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from app.database import AsyncSessionLocal, async_engine
+from app.core.counters import rebuild_counters
+
+async def main():
+    print("🔄 Rebuilding lead counters...")
+    
+    try:
+        async with AsyncSessionLocal() as db:
+            await rebuild_counters(db)
+            await db.commit()
+        print("✅ Lead counters rebuilt successfully!")
+    except Exception as e:
+        print(f"❌ Error rebuilding counters: {e}")
+        sys.exit(1)
+    finally:
+        await async_engine.dispose()
+
+if __name__ == "__main__":
+    asyncio.run(main())
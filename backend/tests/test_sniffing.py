@@ -0,0 +1,74 @@
+"""
+Upload type checks on the libmagic path, with python-magic replaced by a stub
+(libmagic may be missing here and its answers vary between versions)
+
+    python -m pytest tests
+"""
+import asyncio
+import pytest
+from app.core import sniffing
+from app.core.sniffing import KNOWN_CONTENT_TYPES, UploadTypeError, check_upload_type
+
+OLE_HEAD = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\x00" * 504
+ZIP_HEAD = b"PK\x03\x04\x14\x00\x06\x00\x08\x00" + b"\x00" * 502
+
+# First bytes of a file of each known extension, cut off like a sniffed window
+HEADS = {
+    ".pdf": b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n1 0 obj\n",
+    ".doc": OLE_HEAD,
+    ".xls": OLE_HEAD,
+    ".docx": ZIP_HEAD,
+    ".xlsx": ZIP_HEAD,
+    ".jpg": b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01",
+    ".jpeg": b"\xff\xd8\xff\xe1\x00\x18Exif\x00\x00",
+    ".png": b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR",
+    ".gif": b"GIF89a\x01\x00\x01\x00\x80\x00\x00",
+    ".webp": b"RIFF\x24\x00\x00\x00WEBPVP8 ",
+    ".txt": "Plain text résumé\n".encode(),
+}
+
+class FakeMagic:
+    """
+    Stands in for the magic module: from_buffer() always reports media_type
+    """
+    def __init__(self, media_type: str):
+        self.media_type = media_type
+
+    def from_buffer(self, head: bytes, mime: bool = False) -> str:
+        return self.media_type
+
+def check(extension: str, head: bytes):
+    asyncio.run(check_upload_type(head, extension, KNOWN_CONTENT_TYPES))
+
+def test_every_known_extension_has_a_sample():
+    assert set(HEADS) == set(KNOWN_CONTENT_TYPES)
+
+@pytest.mark.parametrize("extension", sorted(KNOWN_CONTENT_TYPES))
+def test_libmagic_types_are_accepted(monkeypatch, extension):
+    for media_type in KNOWN_CONTENT_TYPES[extension]:
+        monkeypatch.setattr(sniffing, "magic", FakeMagic(media_type))
+        check(extension, HEADS[extension])
+
+@pytest.mark.parametrize("generic", ["application/octet-stream", "application/CDFV2-corrupt"])
+@pytest.mark.parametrize("extension", sorted(KNOWN_CONTENT_TYPES))
+def test_generic_libmagic_answer_falls_back_to_signatures(monkeypatch, extension, generic):
+    monkeypatch.setattr(sniffing, "magic", FakeMagic(generic))
+    check(extension, HEADS[extension])
+
+def test_generic_libmagic_answer_without_signature_is_rejected(monkeypatch):
+    monkeypatch.setattr(sniffing, "magic", FakeMagic("application/octet-stream"))
+    with pytest.raises(UploadTypeError):
+        check(".docx", b"\x00\x01\x02\x03" * 64)
+
+def test_specific_libmagic_mismatch_is_rejected(monkeypatch):
+    # A specific answer is trusted, the signature table is not consulted
+    monkeypatch.setattr(sniffing, "magic", FakeMagic("application/x-dosexec"))
+    with pytest.raises(UploadTypeError):
+        check(".pdf", HEADS[".pdf"])
+
+def test_empty_and_disallowed_uploads_are_rejected(monkeypatch):
+    monkeypatch.setattr(sniffing, "magic", FakeMagic("application/pdf"))
+    with pytest.raises(UploadTypeError):
+        check(".pdf", b"")
+    with pytest.raises(UploadTypeError):
+        asyncio.run(check_upload_type(HEADS[".pdf"], ".pdf", [".docx"]))